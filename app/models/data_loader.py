@@ -8,6 +8,13 @@ import logging              # Pour enregistrer les messages de débogage et d'er
 from datetime import datetime  # Pour gérer les dates et heures
 from app.utils.error_handler import DataProcessingError  # Exception personnalisée pour les erreurs de données
 
+# Import optionnel de python-calamine (lecteur XLSX en Rust, bien plus rapide qu'openpyxl)
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
 # Configuration du logger pour ce module (affichage des messages de debug/info/erreur)
 logger = logging.getLogger(__name__)
 
@@ -163,7 +170,7 @@ class DataLoader:
             if file_path.exists():
                 
                 # Lire le fichier Excel et créer un DataFrame pandas
-                self._inscription_df = pd.read_excel(file_path)
+                self._inscription_df = pd.read_excel(file_path, engine=EXCEL_ENGINE)
                 
                 # Enregistrer l'heure de chargement pour la vérification de modification
                 self._last_load_time['inscriptions'] = datetime.now().timestamp()
@@ -194,7 +201,7 @@ class DataLoader:
             if file_path.exists():
                 
                 # Lire le fichier Excel et créer un DataFrame pandas
-                self._presence_df = pd.read_excel(file_path)
+                self._presence_df = pd.read_excel(file_path, engine=EXCEL_ENGINE)
                 
                 # Enregistrer l'heure de chargement
                 self._last_load_time['presences'] = datetime.now().timestamp()
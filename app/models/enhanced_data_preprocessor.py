@@ -11,11 +11,30 @@ import warnings
 from sklearn.preprocessing import StandardScaler, LabelEncoder, RobustScaler
 from sklearn.impute import SimpleImputer
 from sklearn.ensemble import IsolationForest
+from joblib import Memory
+import hashlib
 import os
 
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
+# Disk cache for fitted scalers, keyed on a content hash of the fitted data
+_fit_memory = Memory(location=".cache/ml", verbose=0)
+
+def _content_hash(data):
+    """Fast blake2b digest of a DataFrame/array/sequence content"""
+    values = np.asarray(data)
+    if values.dtype == object:
+        payload = '\x1f'.join(map(str, values.ravel())).encode('utf-8')
+    else:
+        payload = np.ascontiguousarray(values).tobytes()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+@_fit_memory.cache(ignore=['X'])
+def _fit_scaler(X_hash, kind, X):
+    scaler_cls = RobustScaler if kind == 'robust' else StandardScaler
+    return scaler_cls().fit(X)
+
 class EnhancedDataPreprocessor:
     """
     Enhanced preprocessing with validation, outlier detection, and feature engineering
@@ -31,10 +50,9 @@ class EnhancedDataPreprocessor:
         self.scalers = {}
         self.validation_results = {}
         
-        # Create visualization folder
+        # Visualization folder (nothing is written here, so it is not created)
         self.viz_folder = Path("app/static/img/ml_viz")
-        self.viz_folder.mkdir(parents=True, exist_ok=True)
-        
+
     def validate_input_file(self):
         """
         Validate input Excel file structure and quality
@@ -84,7 +102,7 @@ class EnhancedDataPreprocessor:
                     }
                     
                     # Temporal quality checks
-                    yearly_counts = dates.groupby(dates.dt.year).size()
+                    yearly_counts = dates.dt.year.value_counts(sort=False)
                     if yearly_counts.min() < 10:
                         validation_results['issues'].append("Some years have very few enrollments (<10)")
                     if yearly_counts.std() > yearly_counts.mean():
@@ -123,14 +141,15 @@ class EnhancedDataPreprocessor:
         start_date = datetime(2015, 1, 1)
         end_date = datetime(2025, 12, 31)
         
-        # Create monthly data points
-        dates = []
-        enrollments = []
+        # Preallocate monthly data points
+        n_months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month) + 1
+        dates_arr = np.empty(n_months, dtype="datetime64[M]")
+        enrollments_arr = np.empty(n_months, dtype=np.int32)
         
         current_date = start_date
         base_trend = 50  # Base enrollments per year
         
-        while current_date <= end_date:
+        for i in range(n_months):
             # Seasonal pattern (higher in Sept-Oct, Jan-Feb, lower in Jul-Aug)
             month = current_date.month
             seasonal_factor = {
@@ -148,8 +167,8 @@ class EnhancedDataPreprocessor:
             monthly_base = (base_trend * year_growth * seasonal_factor * noise) / 12
             monthly_enrollments = max(1, int(np.round(monthly_base)))
             
-            dates.append(current_date)
-            enrollments.append(monthly_enrollments)
+            dates_arr[i] = np.datetime64(current_date, 'M')
+            enrollments_arr[i] = monthly_enrollments
             
             # Move to next month
             if current_date.month == 12:
@@ -159,14 +178,14 @@ class EnhancedDataPreprocessor:
         
         # Create demonstration dataframe
         demo_df = pd.DataFrame({
-            'date': dates,
-            'enrollments': enrollments
+            'date': dates_arr.astype("datetime64[ns]"),
+            'enrollments': enrollments_arr
         })
         
         # Add additional features for demonstration
-        demo_df['year'] = demo_df['date'].dt.year
-        demo_df['month'] = demo_df['date'].dt.month
-        demo_df['quarter'] = demo_df['date'].dt.quarter
+        demo_df['year'] = demo_df['date'].dt.year.astype(np.int16)
+        demo_df['month'] = demo_df['date'].dt.month.astype(np.int8)
+        demo_df['quarter'] = demo_df['date'].dt.quarter.astype(np.int8)
         demo_df['is_academic_start'] = demo_df['month'].isin([9, 10, 1, 2]).astype(int)
         demo_df['is_summer'] = demo_df['month'].isin([6, 7, 8]).astype(int)
         
@@ -174,7 +193,7 @@ class EnhancedDataPreprocessor:
         demo_path = self.data_folder / "demonstration_enrollments.xlsx"
         demo_df.to_excel(demo_path, index=False)
         
-        logger.info(f"✅ Demonstration dataset created: {len(demo_df)} months from {dates[0]} to {dates[-1]}")
+        logger.info(f"✅ Demonstration dataset created: {len(demo_df)} months from {demo_df['date'].iloc[0]} to {demo_df['date'].iloc[-1]}")
         logger.info(f"📁 Saved to: {demo_path}")
         
         return demo_df
@@ -273,6 +292,7 @@ class EnhancedDataPreprocessor:
             
             # Create proper date column
             monthly_data['date'] = pd.to_datetime(monthly_data[['year', 'month']].assign(day=1))
+            monthly_data = monthly_data.astype({'year': np.int16, 'month': np.int8})
             monthly_data = monthly_data.sort_values('date').reset_index(drop=True)
             
             # Create lag features
@@ -327,6 +347,16 @@ class EnhancedDataPreprocessor:
             'full_data': df_ml
         }
     
+    def fit_scaler(self, name, X, kind='standard'):
+        """
+        Fit (or reuse a cached) StandardScaler/RobustScaler and register it in self.scalers
+        """
+        columns = tuple(X.columns) if hasattr(X, 'columns') else ()
+        X_hash = (columns, X.shape, _content_hash(X))
+        scaler = _fit_scaler(X_hash, kind, X)
+        self.scalers[name] = scaler
+        return scaler
+    
     def get_preprocessing_summary(self):
         """
         Get comprehensive preprocessing summary
@@ -3,14 +3,19 @@
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.figure import Figure  # Figure sans pyplot : rendu fichier (Agg) sans toucher au backend global
+from matplotlib import font_manager
 import logging
 from pathlib import Path
 from datetime import datetime, timedelta
 import warnings
-from sklearn.preprocessing import StandardScaler, LabelEncoder, OneHotEncoder
-from sklearn.impute import SimpleImputer
+from sklearn.preprocessing import StandardScaler, OneHotEncoder
+from scipy import sparse
+from joblib import Parallel, delayed
+import joblib
 import os
+import hashlib
 
 # Import optionnel de plotly
 try:
@@ -22,35 +27,85 @@ except ImportError:
     PLOTLY_AVAILABLE = False
     print("⚠️ Plotly non disponible - utilisation de matplotlib uniquement")
 
+# Lecteur XLSX partagé avec le DataLoader (calamine si disponible, sinon openpyxl)
+from app.models.data_loader import EXCEL_ENGINE
+
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
+# Simplification des tracés pour accélérer le rendu Agg (appliquée seulement pendant l'EDA, via rc_context)
+FAST_RENDER_RC = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+}
+
+def _cyclic_features(values, period):
+    """Encodage cyclique (sin, cos) en float32 d'une série d'entiers (NaN conservés)"""
+    angle = 2 * np.pi * pd.Series(values).to_numpy(dtype=np.float32, na_value=np.nan) / period
+    return np.sin(angle), np.cos(angle)
+
+def _normalized_years(years):
+    """Années ramenées dans [0, 1] (0 si une seule année)"""
+    values = years.to_numpy(dtype=np.float32)
+    if len(values) == 0:
+        return values
+    span = max(values.max() - values.min(), 1)
+    return (values - values.min()) / span
+
+# Colonnes de dates converties une seule fois lors du nettoyage
+DATE_COLUMNS = ['Date inscription', 'Première venue', 'Date de naissance', 'Arrivée en France']
+
 class DataPreprocessor:
     """
     Classe complète pour le preprocessing des données d'inscription
     Optimisée pour la prédiction temporelle d'inscriptions futures
     """
     
-    def __init__(self, data_folder_path):
+    def __init__(self, data_folder_path, generate_plots=True):
         """
         Initialise le preprocessor
         
         Args:
             data_folder_path (str): Chemin vers le dossier contenant inscription.xlsx
+            generate_plots (bool): Génère les graphiques de l'EDA (désactiver pour l'entraînement seul)
         """
         self.data_folder = Path(data_folder_path)
+        self.generate_plots = generate_plots
+        # Résolution des PNG de l'EDA (100 DPI suffit pour le tableau de bord)
+        self.plot_dpi = self._read_plot_dpi()
+        if generate_plots:
+            # Précharger la police par défaut pour éviter le coût au premier graphique
+            font_manager.findfont('DejaVu Sans')
         self.file_path = self.data_folder / "inscription.xlsx"
         self.df_raw = None
+        self.original_shape = None  # Dimensions du fichier brut (conservées aussi dans le cache)
         self.df_clean = None
         self.df_temporal = None
         self.encoders = {}
         self.scalers = {}
         self.eda_results = {}
         
+        # Encodage One-Hot conservé au format creux (CSR), aligné sur les lignes de df_clean
+        self.X_onehot_sparse = None
+        self.onehot_feature_names = []
+        
         # Créer le dossier pour les visualisations
         self.viz_folder = Path("app/static/img/ml_viz")
         self.viz_folder.mkdir(parents=True, exist_ok=True)
         
+    @staticmethod
+    def _read_plot_dpi(default=100):
+        """Résolution lue dans ML_VIZ_DPI ; valeur par défaut si absente, invalide ou non positive"""
+        raw_dpi = os.environ.get('ML_VIZ_DPI', '')
+        try:
+            dpi = int(raw_dpi)
+        except ValueError:
+            if raw_dpi:
+                logger.warning(f"⚠️ ML_VIZ_DPI invalide ({raw_dpi!r}), utilisation de {default} DPI")
+            return default
+        return dpi if dpi > 0 else default
+    
     def load_data(self):
         """
         Charge et analyse les données d'inscription
@@ -61,7 +116,8 @@ class DataPreprocessor:
         logger.info("=== CHARGEMENT DONNÉES INSCRIPTION ===")
         
         try:
-            self.df_raw = pd.read_excel(self.file_path)
+            self.df_raw = self._read_excel_cached()
+            self.original_shape = self.df_raw.shape
             
             logger.info(f"✅ Dataset chargé: {self.df_raw.shape[0]} lignes, {self.df_raw.shape[1]} colonnes")
             logger.info(f"📊 Colonnes: {list(self.df_raw.columns)}")
@@ -76,6 +132,127 @@ class DataPreprocessor:
             logger.error(f"❌ Erreur lors du chargement: {e}")
             raise
     
+    def _source_digest(self):
+        """Empreinte (blake2b) du contenu de inscription.xlsx, clé des caches du preprocessing"""
+        return hashlib.blake2b(self.file_path.read_bytes(), digest_size=16).hexdigest()
+    
+    def _read_excel_cached(self):
+        """
+        Lit inscription.xlsx via un cache pickle dans data/.cache/, indexé par l'empreinte du contenu
+        
+        Le pickle conserve les colonnes à types mixtes (dates et texte, nombres et texte)
+        que Parquet refuse de sérialiser.
+        """
+        cache_dir = self.data_folder / '.cache'
+        cached_path = cache_dir / f'inscription_raw_{self._source_digest()}.pkl'
+        
+        if cached_path.exists():
+            try:
+                logger.info(f"⚡ Lecture depuis le cache: {cached_path.name}")
+                return pd.read_pickle(cached_path)
+            except Exception as e:
+                logger.warning(f"⚠️ Cache illisible, relecture Excel: {e}")
+        
+        df = pd.read_excel(self.file_path, engine=EXCEL_ENGINE)
+        
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Supprimer les versions obsolètes avant d'écrire la nouvelle
+            for old_cache in cache_dir.glob('inscription_raw_*.pkl'):
+                old_cache.unlink(missing_ok=True)
+            df.to_pickle(cached_path)
+        except Exception as e:
+            logger.warning(f"⚠️ Impossible de créer le cache du fichier Excel: {e}")
+        
+        return df
+    
+    def run_preprocessing(self, force=False):
+        """
+        Enchaîne chargement, nettoyage, features temporelles et encodage,
+        en réutilisant le résultat mis en cache pour la même version du fichier source
+        
+        Args:
+            force (bool): Ignore le cache et relance tout le preprocessing
+            
+        Returns:
+            pd.DataFrame: DataFrame nettoyé et encodé
+        """
+        if not force and self._load_processed_cache():
+            return self.df_clean
+        
+        self.load_data()
+        self.handle_missing_values()
+        self.create_temporal_features()
+        self.encode_categorical_features()
+        self._save_processed_cache()
+        
+        return self.df_clean
+    
+    def _processed_cache_path(self):
+        """Chemin du cache (joblib) associé au contenu courant du fichier source"""
+        return self.data_folder / '.cache' / f'inscription_clean_{self._source_digest()}.joblib'
+    
+    def _load_processed_cache(self):
+        """Recharge df_clean, les agrégations et les encodeurs depuis le cache s'il est à jour"""
+        if not self.file_path.exists():
+            return False
+        
+        state_path = self._processed_cache_path()
+        if not state_path.exists():
+            return False
+        
+        try:
+            state = joblib.load(state_path)
+        except Exception as e:
+            logger.warning(f"⚠️ Cache du preprocessing illisible: {e}")
+            return False
+        
+        self.df_clean = state['df_clean']
+        self.original_shape = state['original_shape']
+        self.yearly_counts = state['yearly_counts']
+        self.monthly_counts = state['monthly_counts']
+        self.weekly_counts = state['weekly_counts']
+        self.encoders = state['encoders']
+        self.X_onehot_sparse = state['X_onehot_sparse']
+        self.onehot_feature_names = state['onehot_feature_names']
+        self.eda_results['temporal_aggregations'] = {
+            'yearly': self.yearly_counts,
+            'monthly': self.monthly_counts,
+            'weekly': self.weekly_counts
+        }
+        
+        logger.info(f"⚡ Preprocessing rechargé depuis le cache: {state_path.name}")
+        return True
+    
+    def _save_processed_cache(self):
+        """
+        Sauvegarde df_clean et l'état associé (joblib) en supprimant les anciennes versions
+        
+        joblib/pickle conserve les colonnes à types mixtes (nombres et texte de remplissage)
+        que Parquet refuse de sérialiser.
+        """
+        state_path = self._processed_cache_path()
+        
+        try:
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            for old_cache in state_path.parent.glob('inscription_clean_*'):
+                if old_cache != state_path:
+                    old_cache.unlink()
+            
+            joblib.dump({
+                'df_clean': self.df_clean,
+                'original_shape': self.original_shape,
+                'yearly_counts': self.yearly_counts,
+                'monthly_counts': self.monthly_counts,
+                'weekly_counts': self.weekly_counts,
+                'encoders': self.encoders,
+                'X_onehot_sparse': self.X_onehot_sparse,
+                'onehot_feature_names': self.onehot_feature_names
+            }, state_path)
+        except Exception as e:
+            logger.warning(f"⚠️ Impossible de mettre en cache le preprocessing: {e}")
+            state_path.unlink(missing_ok=True)
+    
     def _analyze_missing_values(self):
         """Analyse détaillée des valeurs manquantes"""
         missing_info = self.df_raw.isnull().sum()
@@ -109,45 +286,60 @@ class DataPreprocessor:
         self.df_clean = self.df_raw.copy()
         
         # Stratégies de nettoyage par importance pour la prédiction temporelle
-        cleaning_strategies = {
+        # Liste ordonnée (colonne, stratégie) : une colonne n'apparaît qu'une fois,
+        # et les entrées 'drop_column' restent en dernier
+        cleaning_strategies = [
             # Variables temporelles CRITIQUES - imputation intelligente
-            'Date inscription': 'interpolate_date',
-            'Première venue': 'interpolate_date',
-            'Date de naissance': 'median_date',
-            'Arrivée en France': 'median_date',
+            ('Date inscription', 'interpolate_date'),
+            ('Première venue', 'interpolate_date'),
+            ('Date de naissance', 'median_date'),
+            ('Arrivée en France', 'median_date'),
             
             # Variables démographiques importantes
-            'Sexe': 'mode',
-            'Age': 'median_numeric',
-            'Nationalité': 'mode',
-            'Continent': 'most_frequent',
-            'Pays de naissance': 'most_frequent',
+            ('Sexe', 'mode'),
+            ('Nationalité', 'mode'),
+            ('Pays de naissance', 'most_frequent'),
             
             # Variables géographiques
-            'Code postal': 'mode',
-            'Ville': 'mode',
-            'Prioritaire/Veille': 'mode',
+            ('Code postal', 'mode'),
+            ('Ville', 'mode'),
+            ('Prioritaire/Veille', 'mode'),
             
             # Variables socio-économiques
-            'Situation Familiale': 'mode',
-            'Type de logement': 'most_frequent',
-            'Revenus': 'median_categorical',
+            ('Situation Familiale', 'mode'),
+            ('Type de logement', 'most_frequent'),
+            ('Revenus', 'median_categorical'),
             
-            # Variables avec trop de valeurs manquantes - suppression ou imputation simple
-            'Age': 'drop_column',  # 99% manquant
-            'Continent': 'drop_column',  # 99% manquant
-            'ISO': 'drop_column',  # 98% manquant
-            'Statut actuel': 'drop_column',  # 99% manquant
-            'Structure actuelle': 'drop_column',  # 99% manquant
-            'Document': 'most_frequent',  # Garder mais imputer
-            'Email': 'fill_missing',  # Marquer comme "Non fourni"
-            'Téléphone': 'fill_missing',
-            'Commentaires': 'fill_missing'
-        }
-        
-        for column, strategy in cleaning_strategies.items():
+            # Variables peu renseignées - imputation simple
+            ('Document', 'most_frequent'),  # Garder mais imputer
+            ('Email', 'fill_missing'),  # Marquer comme "Non fourni"
+            ('Téléphone', 'fill_missing'),
+            ('Commentaires', 'fill_missing'),
+            
+            # Variables avec trop de valeurs manquantes - suppression
+            ('Age', 'drop_column'),  # 99% manquant
+            ('Continent', 'drop_column'),  # 99% manquant
+            ('ISO', 'drop_column'),  # 98% manquant
+            ('Statut actuel', 'drop_column'),  # 99% manquant
+            ('Structure actuelle', 'drop_column'),  # 99% manquant
+        ]
+        
+        # Conversion unique des colonnes de dates (réutilisée par les stratégies et les features temporelles)
+        date_columns = [col for col in DATE_COLUMNS if col in self.df_clean.columns]
+        if date_columns:
+            self.df_clean[date_columns] = self.df_clean[date_columns].apply(pd.to_datetime, errors='coerce')
+        
+        # Regrouper les colonnes présentes par stratégie pour un traitement vectorisé
+        columns_by_strategy = {}
+        for column, strategy in cleaning_strategies:
             if column in self.df_clean.columns:
-                self._apply_cleaning_strategy(column, strategy)
+                columns_by_strategy.setdefault(strategy, []).append(column)
+        
+        for strategy, columns in columns_by_strategy.items():
+            self._apply_cleaning_strategy(columns, strategy)
+        
+        # Réduction de l'empreinte mémoire une fois les valeurs imputées
+        self._downcast_dtypes()
         
         # Rapport final
         initial_missing = self.df_raw.isnull().sum().sum()
@@ -156,43 +348,50 @@ class DataPreprocessor:
         
         return self.df_clean
     
-    def _apply_cleaning_strategy(self, column, strategy):
-        """Applique une stratégie de nettoyage spécifique"""
+    def _apply_cleaning_strategy(self, columns, strategy):
+        """Applique une stratégie de nettoyage à un groupe de colonnes en une seule opération"""
         try:
             if strategy == 'drop_column':
-                self.df_clean.drop(columns=[column], inplace=True)
-                logger.info(f"🗑️ Colonne supprimée: {column}")
-                
-            elif strategy == 'mode':
-                mode_value = self.df_clean[column].mode().iloc[0] if not self.df_clean[column].mode().empty else 'Inconnu'
-                self.df_clean[column].fillna(mode_value, inplace=True)
+                self.df_clean.drop(columns=columns, inplace=True)
+                logger.info(f"🗑️ Colonnes supprimées: {columns}")
                 
-            elif strategy == 'most_frequent':
-                most_frequent = self.df_clean[column].value_counts().index[0] if len(self.df_clean[column].value_counts()) > 0 else 'Inconnu'
-                self.df_clean[column].fillna(most_frequent, inplace=True)
+            elif strategy in ('mode', 'most_frequent'):
+                modes = self.df_clean[columns].mode(dropna=True)
+                mode_row = modes.iloc[0] if len(modes) > 0 else pd.Series(index=columns, dtype=object)
+                self.df_clean[columns] = self.df_clean[columns].fillna(mode_row.fillna('Inconnu'))
                 
             elif strategy == 'median_numeric':
                 # Essayer de convertir en numérique et prendre la médiane
-                numeric_values = pd.to_numeric(self.df_clean[column], errors='coerce')
-                median_val = numeric_values.median()
-                self.df_clean[column].fillna(median_val, inplace=True)
+                medians = self.df_clean[columns].apply(pd.to_numeric, errors='coerce').median()
+                self.df_clean[columns] = self.df_clean[columns].fillna(medians)
                 
             elif strategy == 'interpolate_date':
-                # Interpolation temporelle pour les dates
-                date_col = pd.to_datetime(self.df_clean[column], errors='coerce')
-                date_col = date_col.interpolate(method='time')
-                self.df_clean[column] = date_col
+                # Interpolation temporelle pour les dates (déjà converties)
+                self.df_clean[columns] = self.df_clean[columns].interpolate(method='time')
                 
             elif strategy == 'median_date':
-                date_col = pd.to_datetime(self.df_clean[column], errors='coerce')
-                median_date = date_col.median()
-                self.df_clean[column].fillna(median_date, inplace=True)
+                self.df_clean[columns] = self.df_clean[columns].fillna(self.df_clean[columns].median())
                 
             elif strategy == 'fill_missing':
-                self.df_clean[column].fillna('Non fourni', inplace=True)
+                self.df_clean[columns] = self.df_clean[columns].fillna('Non fourni')
                 
         except Exception as e:
-            logger.warning(f"⚠️ Erreur nettoyage {column} avec {strategy}: {e}")
+            logger.warning(f"⚠️ Erreur nettoyage {columns} avec {strategy}: {e}")
+    
+    def _downcast_dtypes(self):
+        """Convertit les chaînes peu variées en category et réduit les entiers au plus petit type"""
+        memory_before = self.df_clean.memory_usage(deep=True).sum()
+        max_categories = max(1, len(self.df_clean) // 2)
+        
+        for col in self.df_clean.select_dtypes(include=['object']).columns:
+            if col not in DATE_COLUMNS and self.df_clean[col].nunique(dropna=False) <= max_categories:
+                self.df_clean[col] = self.df_clean[col].astype('category')
+        
+        for col in self.df_clean.select_dtypes(include=['integer']).columns:
+            self.df_clean[col] = pd.to_numeric(self.df_clean[col], downcast='integer')
+        
+        memory_after = self.df_clean.memory_usage(deep=True).sum()
+        logger.info(f"✅ Mémoire réduite: {memory_before / 1024:.0f} Ko → {memory_after / 1024:.0f} Ko")
     
     def create_temporal_features(self):
         """
@@ -208,6 +407,8 @@ class DataPreprocessor:
         
         for col in date_columns:
             if col in self.df_clean.columns:
+                if pd.api.types.is_datetime64_any_dtype(self.df_clean[col]):
+                    continue  # Déjà convertie par handle_missing_values
                 try:
                     self.df_clean[col] = pd.to_datetime(self.df_clean[col], errors='coerce')
                     logger.info(f"✅ Date convertie: {col}")
@@ -216,19 +417,23 @@ class DataPreprocessor:
         
         # Utiliser 'Date inscription' comme référence principale
         if 'Date inscription' in self.df_clean.columns:
-            # Créer les features temporelles seulement pour les dates valides
+            # Créer les features temporelles en une passe (entiers nullables : NaT → <NA>)
+            dates = self.df_clean['Date inscription'].dt
             valid_dates = self.df_clean['Date inscription'].notna()
+            months = dates.month.astype('Int8')
             
-            self.df_clean.loc[valid_dates, 'annee_inscription'] = self.df_clean.loc[valid_dates, 'Date inscription'].dt.year
-            self.df_clean.loc[valid_dates, 'mois_inscription'] = self.df_clean.loc[valid_dates, 'Date inscription'].dt.month
-            self.df_clean.loc[valid_dates, 'trimestre_inscription'] = self.df_clean.loc[valid_dates, 'Date inscription'].dt.quarter
-            self.df_clean.loc[valid_dates, 'semaine_inscription'] = self.df_clean.loc[valid_dates, 'Date inscription'].dt.isocalendar().week
-            self.df_clean.loc[valid_dates, 'jour_semaine'] = self.df_clean.loc[valid_dates, 'Date inscription'].dt.dayofweek
+            # Features cycliques pour capturer la saisonnalité (NaN pour les dates invalides)
+            mois_sin, mois_cos = _cyclic_features(months, 12)
             
-            # Features cycliques pour capturer la saisonnalité (seulement pour les valeurs valides)
-            valid_months = self.df_clean['mois_inscription'].notna()
-            self.df_clean.loc[valid_months, 'mois_sin'] = np.sin(2 * np.pi * self.df_clean.loc[valid_months, 'mois_inscription'] / 12)
-            self.df_clean.loc[valid_months, 'mois_cos'] = np.cos(2 * np.pi * self.df_clean.loc[valid_months, 'mois_inscription'] / 12)
+            self.df_clean = self.df_clean.assign(
+                annee_inscription=dates.year.astype('Int16'),
+                mois_inscription=months,
+                trimestre_inscription=dates.quarter.astype('Int8'),
+                semaine_inscription=dates.isocalendar().week.astype('Int8'),
+                jour_semaine=dates.dayofweek.astype('Int8'),
+                mois_sin=mois_sin,
+                mois_cos=mois_cos
+            )
             
             logger.info(f"✅ Features temporelles créées pour {valid_dates.sum()} lignes valides")
         
@@ -242,15 +447,21 @@ class DataPreprocessor:
         """Crée les agrégations temporelles nécessaires pour la prédiction"""
         
         # Filtrer les lignes avec des années valides
-        df_valid = self.df_clean[self.df_clean['annee_inscription'].notna()].copy()
+        df_valid = self.df_clean[self.df_clean['annee_inscription'].notna()]
+        
+        # Comptage unique (année, mois, semaine) dont dérivent les trois agrégations
+        base_counts = df_valid.groupby(
+            ['annee_inscription', 'mois_inscription', 'semaine_inscription'],
+            dropna=False, sort=False, observed=True
+        ).size()
         
         # Agrégations par année
-        self.yearly_counts = df_valid.groupby('annee_inscription').size().reset_index(name='nombre_inscriptions')
+        self.yearly_counts = base_counts.groupby(level=0).sum().reset_index(name='nombre_inscriptions')
         
-        # Agrégations par mois (avec gestion des valeurs manquantes)
-        monthly_valid = df_valid[df_valid['mois_inscription'].notna()].copy()
-        if len(monthly_valid) > 0:
-            self.monthly_counts = monthly_valid.groupby(['annee_inscription', 'mois_inscription']).size().reset_index(name='nombre_inscriptions')
+        # Agrégations par mois (les mois manquants sont écartés par le regroupement)
+        monthly_counts = base_counts.groupby(level=[0, 1]).sum()
+        if len(monthly_counts) > 0:
+            self.monthly_counts = monthly_counts.reset_index(name='nombre_inscriptions')
             # Créer la date avec jour=1 par défaut
             self.monthly_counts['date'] = pd.to_datetime(
                 self.monthly_counts[['annee_inscription', 'mois_inscription']].assign(day=1).rename(
@@ -260,10 +471,10 @@ class DataPreprocessor:
         else:
             self.monthly_counts = pd.DataFrame(columns=['annee_inscription', 'mois_inscription', 'nombre_inscriptions', 'date'])
         
-        # Agrégations par semaine (avec gestion des valeurs manquantes)
-        weekly_valid = df_valid[df_valid['semaine_inscription'].notna()].copy()
-        if len(weekly_valid) > 0:
-            self.weekly_counts = weekly_valid.groupby(['annee_inscription', 'semaine_inscription']).size().reset_index(name='nombre_inscriptions')
+        # Agrégations par semaine (les semaines manquantes sont écartées par le regroupement)
+        weekly_counts = base_counts.groupby(level=[0, 2]).sum()
+        if len(weekly_counts) > 0:
+            self.weekly_counts = weekly_counts.reset_index(name='nombre_inscriptions')
         else:
             self.weekly_counts = pd.DataFrame(columns=['annee_inscription', 'semaine_inscription', 'nombre_inscriptions'])
         
@@ -289,44 +500,79 @@ class DataPreprocessor:
         # Variables à encoder avec Label Encoding (ordinales ou avec beaucoup de catégories)
         label_columns = ['Nationalité', 'Pays de naissance', 'Code postal', 'Ville', 'Prescripteur']
         
-        # One-Hot Encoding
-        for col in onehot_columns:
-            if col in self.df_clean.columns:
-                dummies = pd.get_dummies(self.df_clean[col], prefix=col, dummy_na=True)
-                self.df_clean = pd.concat([self.df_clean, dummies], axis=1)
-                self.df_clean.drop(columns=[col], inplace=True)
-                logger.info(f"✅ One-Hot: {col} → {len(dummies.columns)} colonnes")
-        
-        # Label Encoding
+        # One-Hot Encoding (matrice creuse CSR, une seule passe pour toutes les colonnes)
+        present_onehot = [col for col in onehot_columns if col in self.df_clean.columns]
+        if present_onehot:
+            ohe = OneHotEncoder(sparse_output=True, handle_unknown='ignore', dtype=np.uint8)
+            # astype(str) conserve une catégorie 'nan' pour les valeurs manquantes (équivalent dummy_na)
+            self.X_onehot_sparse = ohe.fit_transform(self.df_clean[present_onehot].astype(str)).tocsr()
+            self.onehot_feature_names = list(ohe.get_feature_names_out(present_onehot))
+            self.encoders['onehot'] = ohe
+            self.df_clean.drop(columns=present_onehot, inplace=True)
+            for col, categories in zip(present_onehot, ohe.categories_):
+                logger.info(f"✅ One-Hot: {col} → {len(categories)} colonnes")
+        
+        # Label Encoding (codes de catégorie triés, équivalents à LabelEncoder)
         for col in label_columns:
             if col in self.df_clean.columns:
-                le = LabelEncoder()
-                self.df_clean[f'{col}_encoded'] = le.fit_transform(self.df_clean[col].astype(str))
-                self.encoders[col] = le
+                cat = self.df_clean[col].astype(str).astype('category')
+                self.df_clean[f'{col}_encoded'] = cat.cat.codes.astype(np.int32)
+                self.encoders[col] = dict(enumerate(cat.cat.categories))
                 logger.info(f"✅ Label: {col} → {col}_encoded")
         
         return self.df_clean
     
-    def perform_eda(self):
+    def _onehot_counts(self, prefix):
+        """Effectifs des colonnes One-Hot commençant par prefix, calculés sur la matrice creuse"""
+        if self.X_onehot_sparse is None:
+            return {}
+        
+        indices = [i for i, name in enumerate(self.onehot_feature_names) if name.startswith(prefix)]
+        if not indices:
+            return {}
+        
+        sums = np.asarray(self.X_onehot_sparse[:, indices].sum(axis=0)).ravel()
+        return {self.onehot_feature_names[i]: int(total) for i, total in zip(indices, sums)}
+    
+    def perform_eda(self, generate_plots=None):
         """
         Analyse exploratoire des données avec visualisations
+        
+        Args:
+            generate_plots (bool, optional): Génère les graphiques matplotlib.
+                Par défaut, la valeur passée au constructeur.
         """
         logger.info("=== ANALYSE EXPLORATOIRE DES DONNÉES ===")
         
         if self.df_clean is None:
             raise ValueError("Les données doivent être préparées avant l'EDA")
         
+        if generate_plots is None:
+            generate_plots = self.generate_plots
+        
         # 1. Analyse temporelle des inscriptions
-        self._plot_temporal_trends()
+        temporal_trends = self._compute_temporal_trends()
         
         # 2. Analyse démographique
-        self._plot_demographic_analysis()
+        demographics = self._compute_demographic_analysis()
         
         # 3. Analyse géographique
-        self._plot_geographic_analysis()
+        geographic = self._compute_geographic_analysis()
         
         # 4. Matrice de corrélation
-        self._plot_correlation_matrix()
+        correlation_matrix = self._compute_correlation_matrix()
+        
+        # Rendu des graphiques (coût dominant de l'EDA, inutile pour l'entraînement)
+        # Une seule figure réutilisée pour tous les graphiques
+        if generate_plots:
+            # Figure hors pyplot : ni backend ni registre de figures globaux, libérée avec la référence
+            with matplotlib.rc_context(FAST_RENDER_RC):
+                fig = Figure(figsize=(15, 12))
+                self._render_temporal_trends(fig, temporal_trends)
+                self._render_demographic_analysis(fig, demographics)
+                self._render_geographic_analysis(fig, geographic)
+                if correlation_matrix is not None:
+                    self._render_correlation_matrix(fig, correlation_matrix)
         
         # 5. Statistiques descriptives
         self._generate_descriptive_stats()
@@ -334,21 +580,49 @@ class DataPreprocessor:
         logger.info(f"✅ EDA terminée - Visualisations sauvées dans {self.viz_folder}")
         return self.eda_results
     
-    def _plot_temporal_trends(self):
+    def _compute_temporal_trends(self):
+        """Agrégations des tendances temporelles"""
+        
+        yearly_data = self.eda_results['temporal_aggregations']['yearly']
+        monthly_data = self.eda_results['temporal_aggregations']['monthly']
+        
+        # Distribution par mois de l'année et par jour de la semaine (domaines connus)
+        month_dist = self.df_clean['mois_inscription'].value_counts(sort=False).reindex(range(1, 13), fill_value=0)
+        dow_dist = self.df_clean['jour_semaine'].value_counts(sort=False).reindex(range(7), fill_value=0)
+        
+        # Sauvegarde des insights
+        self.eda_results['temporal_insights'] = {
+            'total_years': len(yearly_data),
+            'peak_year': yearly_data.loc[yearly_data['nombre_inscriptions'].idxmax(), 'annee_inscription'],
+            'avg_monthly': monthly_data['nombre_inscriptions'].mean(),
+            'peak_month': month_dist.idxmax(),
+            'total_inscriptions': len(self.df_clean)
+        }
+        
+        return {
+            'yearly': yearly_data,
+            'monthly': monthly_data,
+            'month_dist': month_dist,
+            'dow_dist': dow_dist
+        }
+    
+    def _render_temporal_trends(self, fig, trends):
         """Graphiques des tendances temporelles"""
         
         # Graphique des inscriptions par année
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+        fig.clear()
+        fig.set_size_inches(15, 12)
+        axes = fig.subplots(2, 2)
         
         # Inscriptions par année
-        yearly_data = self.eda_results['temporal_aggregations']['yearly']
+        yearly_data = trends['yearly']
         axes[0,0].bar(yearly_data['annee_inscription'], yearly_data['nombre_inscriptions'], color='skyblue')
         axes[0,0].set_title('Nombre d\'inscriptions par année')
         axes[0,0].set_xlabel('Année')
         axes[0,0].set_ylabel('Nombre d\'inscriptions')
         
         # Inscriptions par mois (moyenne mobile)
-        monthly_data = self.eda_results['temporal_aggregations']['monthly']
+        monthly_data = trends['monthly']
         axes[0,1].plot(monthly_data['date'], monthly_data['nombre_inscriptions'], marker='o', color='orange')
         axes[0,1].set_title('Évolution mensuelle des inscriptions')
         axes[0,1].set_xlabel('Date')
@@ -356,128 +630,164 @@ class DataPreprocessor:
         axes[0,1].tick_params(axis='x', rotation=45)
         
         # Distribution par mois de l'année
-        month_dist = self.df_clean.groupby('mois_inscription').size()
+        month_dist = trends['month_dist']
         axes[1,0].bar(month_dist.index, month_dist.values, color='lightgreen')
         axes[1,0].set_title('Distribution saisonnière (par mois)')
         axes[1,0].set_xlabel('Mois')
         axes[1,0].set_ylabel('Total inscriptions')
         
         # Distribution par jour de la semaine
-        dow_dist = self.df_clean.groupby('jour_semaine').size()
+        dow_dist = trends['dow_dist']
         jours = ['Lun', 'Mar', 'Mer', 'Jeu', 'Ven', 'Sam', 'Dim']
-        axes[1,1].bar(range(7), [dow_dist.get(i, 0) for i in range(7)], color='coral')
+        axes[1,1].bar(range(7), dow_dist.values, color='coral')
         axes[1,1].set_title('Distribution par jour de la semaine')
         axes[1,1].set_xlabel('Jour')
         axes[1,1].set_ylabel('Total inscriptions')
         axes[1,1].set_xticks(range(7))
         axes[1,1].set_xticklabels(jours)
         
-        plt.tight_layout()
-        plt.savefig(self.viz_folder / 'temporal_trends.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        # Sauvegarde des insights
-        self.eda_results['temporal_insights'] = {
-            'total_years': len(yearly_data),
-            'peak_year': yearly_data.loc[yearly_data['nombre_inscriptions'].idxmax(), 'annee_inscription'],
-            'avg_monthly': monthly_data['nombre_inscriptions'].mean(),
-            'peak_month': month_dist.idxmax(),
-            'total_inscriptions': len(self.df_clean)
+        fig.tight_layout()
+        fig.savefig(self.viz_folder / 'temporal_trends.png', dpi=self.plot_dpi, bbox_inches='tight')
+    
+    def _compute_demographic_analysis(self):
+        """Effectifs démographiques"""
+        
+        demographics = {
+            'sexe': self._onehot_counts('Sexe_'),
+            'prioritaire': self._onehot_counts('Prioritaire/Veille_'),
+            'nationalites': None,
+            'villes': None
         }
+        
+        # Top 10 nationalités
+        if 'Nationalité_encoded' in self.df_clean.columns:
+            demographics['nationalites'] = self.df_clean['Nationalité_encoded'].value_counts().head(10)
+        
+        # Top 10 villes
+        if 'Ville_encoded' in self.df_clean.columns:
+            demographics['villes'] = self.df_clean['Ville_encoded'].value_counts().head(10)
+        
+        return demographics
     
-    def _plot_demographic_analysis(self):
+    def _render_demographic_analysis(self, fig, demographics):
         """Analyse démographique"""
         
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        fig.clear()
+        fig.set_size_inches(15, 10)
+        axes = fig.subplots(2, 2)
         
         # Distribution par sexe
-        if 'Sexe_F' in self.df_clean.columns and 'Sexe_M' in self.df_clean.columns:
-            sexe_counts = [self.df_clean['Sexe_F'].sum(), self.df_clean['Sexe_M'].sum()]
+        sexe_onehot = demographics['sexe']
+        if 'Sexe_F' in sexe_onehot and 'Sexe_M' in sexe_onehot:
+            sexe_counts = [sexe_onehot['Sexe_F'], sexe_onehot['Sexe_M']]
             axes[0,0].pie(sexe_counts, labels=['Femmes', 'Hommes'], autopct='%1.1f%%', startangle=90)
             axes[0,0].set_title('Répartition par sexe')
         
         # Top 10 nationalités
-        if 'Nationalité_encoded' in self.df_clean.columns:
-            nat_counts = self.df_clean['Nationalité_encoded'].value_counts().head(10)
+        nat_counts = demographics['nationalites']
+        if nat_counts is not None:
             axes[0,1].barh(range(len(nat_counts)), nat_counts.values)
             axes[0,1].set_title('Top 10 Nationalités (encodées)')
             axes[0,1].set_xlabel('Nombre d\'inscriptions')
         
         # Top 10 villes
-        if 'Ville_encoded' in self.df_clean.columns:
-            ville_counts = self.df_clean['Ville_encoded'].value_counts().head(10)
+        ville_counts = demographics['villes']
+        if ville_counts is not None:
             axes[1,0].barh(range(len(ville_counts)), ville_counts.values, color='lightcoral')
             axes[1,0].set_title('Top 10 Villes (encodées)')
             axes[1,0].set_xlabel('Nombre d\'inscriptions')
         
         # Distribution prioritaire/veille
-        prioritaire_cols = [col for col in self.df_clean.columns if col.startswith('Prioritaire/Veille_')]
-        if prioritaire_cols:
-            prioritaire_counts = [self.df_clean[col].sum() for col in prioritaire_cols]
-            labels = [col.replace('Prioritaire/Veille_', '') for col in prioritaire_cols]
+        prioritaire_onehot = demographics['prioritaire']
+        if prioritaire_onehot:
+            prioritaire_counts = list(prioritaire_onehot.values())
+            labels = [col.replace('Prioritaire/Veille_', '') for col in prioritaire_onehot]
             axes[1,1].bar(labels, prioritaire_counts, color='lightsteelblue')
             axes[1,1].set_title('Distribution Prioritaire/Veille')
             axes[1,1].tick_params(axis='x', rotation=45)
         
-        plt.tight_layout()
-        plt.savefig(self.viz_folder / 'demographic_analysis.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(self.viz_folder / 'demographic_analysis.png', dpi=self.plot_dpi, bbox_inches='tight')
+    
+    def _compute_geographic_analysis(self):
+        """Effectifs géographiques (top 15 codes postaux)"""
+        
+        if 'Code postal_encoded' in self.df_clean.columns:
+            return self.df_clean['Code postal_encoded'].value_counts().head(15)
+        return None
     
-    def _plot_geographic_analysis(self):
+    def _render_geographic_analysis(self, fig, cp_counts):
         """Analyse géographique"""
         
         # Top 15 codes postaux
-        if 'Code postal_encoded' in self.df_clean.columns:
-            fig, ax = plt.subplots(1, 1, figsize=(12, 8))
+        if cp_counts is not None:
+            fig.clear()
+            fig.set_size_inches(12, 8)
+            ax = fig.subplots(1, 1)
             
-            cp_counts = self.df_clean['Code postal_encoded'].value_counts().head(15)
             ax.bar(range(len(cp_counts)), cp_counts.values, color='darkseagreen')
             ax.set_title('Top 15 Codes Postaux (encodés)')
             ax.set_xlabel('Code Postal (ID encodé)')
             ax.set_ylabel('Nombre d\'inscriptions')
             
-            plt.tight_layout()
-            plt.savefig(self.viz_folder / 'geographic_analysis.png', dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.tight_layout()
+            fig.savefig(self.viz_folder / 'geographic_analysis.png', dpi=self.plot_dpi, bbox_inches='tight')
     
-    def _plot_correlation_matrix(self):
-        """Matrice de corrélation des variables numériques"""
+    def _compute_correlation_matrix(self):
+        """Matrice de corrélation des variables numériques et corrélations fortes"""
         
         # Sélectionner uniquement les colonnes numériques
         numeric_cols = self.df_clean.select_dtypes(include=[np.number]).columns
         correlation_data = self.df_clean[numeric_cols]
         
-        if len(correlation_data.columns) > 1:
-            plt.figure(figsize=(12, 10))
+        if len(correlation_data.columns) <= 1:
+            return None
+        
+        values = correlation_data.to_numpy(dtype=np.float32, na_value=np.nan)
+        if np.isnan(values).any():
+            # Valeurs manquantes : corrélation par paires de pandas
             correlation_matrix = correlation_data.corr()
-            
-            # Simple heatmap with matplotlib
-            plt.imshow(correlation_matrix, cmap='coolwarm', vmin=-1, vmax=1)
-            plt.colorbar(shrink=0.8)
-            plt.title('Matrice de Corrélation des Variables Numériques')
-            
-            # Ajouter les labels si pas trop nombreux
-            if len(correlation_matrix.columns) < 20:
-                plt.xticks(range(len(correlation_matrix.columns)), correlation_matrix.columns, rotation=45)
-                plt.yticks(range(len(correlation_matrix.columns)), correlation_matrix.columns)
-            
-            plt.tight_layout()
-            plt.savefig(self.viz_folder / 'correlation_matrix.png', dpi=300, bbox_inches='tight')
-            plt.close()
-            
-            # Sauvegarder les corrélations fortes
-            strong_corr = []
-            for i in range(len(correlation_matrix.columns)):
-                for j in range(i+1, len(correlation_matrix.columns)):
-                    corr_val = correlation_matrix.iloc[i, j]
-                    if abs(corr_val) > 0.5:  # Corrélation forte
-                        strong_corr.append({
-                            'var1': correlation_matrix.columns[i],
-                            'var2': correlation_matrix.columns[j],
-                            'correlation': corr_val
-                        })
-            
-            self.eda_results['strong_correlations'] = strong_corr
+        else:
+            # Pas de NaN : un seul calcul matriciel en float32
+            correlation_matrix = pd.DataFrame(
+                np.corrcoef(values, rowvar=False),
+                index=correlation_data.columns,
+                columns=correlation_data.columns
+            )
+        
+        # Sauvegarder les corrélations fortes (triangle supérieur, |r| > 0.5)
+        mat = correlation_matrix.to_numpy()
+        ii, jj = np.nonzero(np.triu(np.abs(mat) > 0.5, k=1))
+        cols = correlation_matrix.columns.to_numpy()
+        strong_corr = [
+            {'var1': cols[i], 'var2': cols[j], 'correlation': float(mat[i, j])}
+            for i, j in zip(ii, jj)
+        ]
+        
+        self.eda_results['strong_correlations'] = strong_corr
+        return correlation_matrix
+    
+    def _render_correlation_matrix(self, fig, correlation_matrix):
+        """Heatmap de la matrice de corrélation"""
+        
+        fig.clear()
+        fig.set_size_inches(12, 10)
+        ax = fig.subplots(1, 1)
+        
+        # Simple heatmap with matplotlib
+        image = ax.imshow(correlation_matrix, cmap='coolwarm', vmin=-1, vmax=1)
+        fig.colorbar(image, ax=ax, shrink=0.8)
+        ax.set_title('Matrice de Corrélation des Variables Numériques')
+        
+        # Ajouter les labels si pas trop nombreux
+        if len(correlation_matrix.columns) < 20:
+            ax.set_xticks(range(len(correlation_matrix.columns)))
+            ax.set_xticklabels(correlation_matrix.columns, rotation=45)
+            ax.set_yticks(range(len(correlation_matrix.columns)))
+            ax.set_yticklabels(correlation_matrix.columns)
+        
+        fig.tight_layout()
+        fig.savefig(self.viz_folder / 'correlation_matrix.png', dpi=self.plot_dpi, bbox_inches='tight')
     
     def _generate_descriptive_stats(self):
         """Génère les statistiques descriptives"""
@@ -485,7 +795,7 @@ class DataPreprocessor:
         stats = {
             'dataset_shape': self.df_clean.shape,
             'numeric_vars': len(self.df_clean.select_dtypes(include=[np.number]).columns),
-            'categorical_vars': len(self.df_clean.select_dtypes(include=['object']).columns),
+            'categorical_vars': len(self.df_clean.select_dtypes(include=['object', 'category']).columns),
             'missing_values': self.df_clean.isnull().sum().sum(),
             'date_range': {
                 'min_date': self.df_clean['Date inscription'].min() if 'Date inscription' in self.df_clean.columns else None,
@@ -531,23 +841,28 @@ class DataPreprocessor:
             raise ValueError("Les données doivent être préprocessées avant la préparation ML")
         
         # Dataset pour prédiction temporelle (agrégations)
-        ml_datasets = {
-            'yearly_prediction': self._prepare_yearly_dataset(),
-            'monthly_prediction': self._prepare_monthly_dataset(),
-            'weekly_prediction': self._prepare_weekly_dataset(),
-            'individual_features': self._prepare_individual_dataset()
+        # Préparations indépendantes (lecture seule) : exécutées en parallèle sur des threads
+        builders = {
+            'yearly_prediction': self._prepare_yearly_dataset,
+            'monthly_prediction': self._prepare_monthly_dataset,
+            'weekly_prediction': self._prepare_weekly_dataset,
+            'individual_features': self._prepare_individual_dataset
         }
+        results = Parallel(n_jobs=len(builders), prefer='threads')(
+            delayed(builder)() for builder in builders.values()
+        )
+        ml_datasets = dict(zip(builders.keys(), results))
         
         logger.info("✅ Datasets ML préparés")
         return ml_datasets
     
     def _prepare_yearly_dataset(self):
         """Prépare le dataset pour prédiction annuelle"""
-        yearly_data = self.yearly_counts.copy()
-        
-        # Ajouter des features temporelles
-        yearly_data['annee_normalized'] = (yearly_data['annee_inscription'] - yearly_data['annee_inscription'].min()) / (yearly_data['annee_inscription'].max() - yearly_data['annee_inscription'].min())
-        yearly_data['trend'] = range(len(yearly_data))
+        # Ajouter des features temporelles (assign : nouveau frame sans copier l'original)
+        yearly_data = self.yearly_counts.assign(
+            annee_normalized=_normalized_years(self.yearly_counts['annee_inscription']),
+            trend=np.arange(len(self.yearly_counts), dtype=np.int32)
+        )
         
         return {
             'features': yearly_data[['annee_inscription', 'annee_normalized', 'trend']],
@@ -557,13 +872,15 @@ class DataPreprocessor:
     
     def _prepare_monthly_dataset(self):
         """Prépare le dataset pour prédiction mensuelle"""
-        monthly_data = self.monthly_counts.copy()
+        mois_sin, mois_cos = _cyclic_features(self.monthly_counts['mois_inscription'], 12)
         
         # Features temporelles avancées
-        monthly_data['mois_sin'] = np.sin(2 * np.pi * monthly_data['mois_inscription'] / 12)
-        monthly_data['mois_cos'] = np.cos(2 * np.pi * monthly_data['mois_inscription'] / 12)
-        monthly_data['trend'] = range(len(monthly_data))
-        monthly_data['annee_normalized'] = (monthly_data['annee_inscription'] - monthly_data['annee_inscription'].min()) / (monthly_data['annee_inscription'].max() - monthly_data['annee_inscription'].min())
+        monthly_data = self.monthly_counts.assign(
+            mois_sin=mois_sin,
+            mois_cos=mois_cos,
+            trend=np.arange(len(self.monthly_counts), dtype=np.int32),
+            annee_normalized=_normalized_years(self.monthly_counts['annee_inscription'])
+        )
         
         return {
             'features': monthly_data[['annee_inscription', 'mois_inscription', 'mois_sin', 'mois_cos', 'trend', 'annee_normalized']],
@@ -573,12 +890,14 @@ class DataPreprocessor:
     
     def _prepare_weekly_dataset(self):
         """Prépare le dataset pour prédiction hebdomadaire"""
-        weekly_data = self.weekly_counts.copy()
+        semaine_sin, semaine_cos = _cyclic_features(self.weekly_counts['semaine_inscription'], 52)
         
         # Features temporelles
-        weekly_data['semaine_sin'] = np.sin(2 * np.pi * weekly_data['semaine_inscription'] / 52)
-        weekly_data['semaine_cos'] = np.cos(2 * np.pi * weekly_data['semaine_inscription'] / 52)
-        weekly_data['trend'] = range(len(weekly_data))
+        weekly_data = self.weekly_counts.assign(
+            semaine_sin=semaine_sin,
+            semaine_cos=semaine_cos,
+            trend=np.arange(len(self.weekly_counts), dtype=np.int32)
+        )
         
         return {
             'features': weekly_data[['annee_inscription', 'semaine_inscription', 'semaine_sin', 'semaine_cos', 'trend']],
@@ -601,12 +920,13 @@ class DataPreprocessor:
         encoded_features = [col for col in self.df_clean.columns if col.endswith('_encoded')]
         feature_cols.extend(encoded_features)
         
-        # Features one-hot
-        onehot_features = [col for col in self.df_clean.columns if any(prefix in col for prefix in ['Sexe_', 'Prioritaire/Veille_', 'Situation Familiale_', 'Type de logement_'])]
-        feature_cols.extend(onehot_features)
-        
         X = self.df_clean[feature_cols].fillna(0)
         
+        # Features one-hot (matrice creuse concaténée aux features numériques)
+        if self.X_onehot_sparse is not None:
+            X = sparse.hstack([sparse.csr_matrix(X.to_numpy(dtype=np.float64)), self.X_onehot_sparse], format='csr')
+            feature_cols = feature_cols + self.onehot_feature_names
+        
         return {
             'features': X,
             'feature_names': feature_cols,
@@ -621,7 +941,7 @@ class DataPreprocessor:
             dict: Résumé des étapes et résultats
         """
         summary = {
-            'original_shape': self.df_raw.shape if self.df_raw is not None else None,
+            'original_shape': self.original_shape,
             'cleaned_shape': self.df_clean.shape if self.df_clean is not None else None,
             'encoders_used': list(self.encoders.keys()),
             'visualizations_created': list(self.viz_folder.glob('*.png')),
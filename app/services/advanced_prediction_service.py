@@ -3,29 +3,31 @@
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import importlib.util
 import logging
 from pathlib import Path
 from datetime import datetime, timedelta
 import warnings
 import json
+import hashlib
+import joblib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Tuple, Optional
 
 # Standard ML imports
-from sklearn.model_selection import TimeSeriesSplit
+from sklearn.model_selection import TimeSeriesSplit, GridSearchCV
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_absolute_error, r2_score, mean_squared_error
-from sklearn.preprocessing import StandardScaler
+
+warnings.filterwarnings('ignore')
+logger = logging.getLogger(__name__)
 
 # Time series specific imports
-try:
-    from prophet import Prophet
-    PROPHET_AVAILABLE = True
-except (ImportError, Exception) as e:
-    PROPHET_AVAILABLE = False
-    logger.info(f"⚠️ Prophet not available: {e} - fallback to other models")
-    Prophet = None
+# Prophet is imported lazily in train_prophet_model (its cmdstanpy import is slow)
+PROPHET_AVAILABLE = importlib.util.find_spec('prophet') is not None
+if not PROPHET_AVAILABLE:
+    logger.info("⚠️ Prophet not available - fallback to other models")
 
 try:
     from statsmodels.tsa.arima.model import ARIMA
@@ -36,8 +38,56 @@ except ImportError:
     STATSMODELS_AVAILABLE = False
     print("⚠️ Statsmodels not available - install with: pip install statsmodels")
 
-warnings.filterwarnings('ignore')
-logger = logging.getLogger(__name__)
+try:
+    from statsforecast.models import AutoARIMA, AutoETS, MSTL
+    STATSFORECAST_AVAILABLE = True
+except ImportError:
+    STATSFORECAST_AVAILABLE = False
+    AutoARIMA = AutoETS = MSTL = None
+
+try:
+    from compiledtrees import CompiledRegressionPredictor
+    COMPILEDTREES_AVAILABLE = True
+except ImportError:
+    COMPILEDTREES_AVAILABLE = False
+    CompiledRegressionPredictor = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Bump when the training code changes in a way the source hash cannot see (e.g. packaged builds)
+MODEL_CACHE_VERSION = 1
+
+
+def _training_code_signature():
+    """
+    Bytes identifying the training code (hyperparameters live in this module),
+    part of the persisted model cache key
+    """
+    signature = f"v{MODEL_CACHE_VERSION}".encode('utf-8')
+    try:
+        signature += Path(__file__).read_bytes()
+    except OSError:
+        pass
+    return signature
+
+
+def _fused_metrics(y_true, y_pred):
+    """Compute (R², MAE) in one pass over the residuals, without sklearn input validation"""
+    y_true = np.asarray(y_true, dtype=np.float64)
+    diff = y_true - np.asarray(y_pred, dtype=np.float64)
+    ss_res = diff @ diff
+    mae = np.abs(diff).mean()
+    centered = y_true - y_true.mean()
+    ss_tot = centered @ centered
+    # Same convention as sklearn's r2_score for a constant target
+    if ss_tot == 0:
+        return (1.0 if ss_res == 0 else 0.0), float(mae)
+    return float(1 - ss_res / ss_tot), float(mae)
 
 class AdvancedPredictionService:
     """
@@ -50,39 +100,75 @@ class AdvancedPredictionService:
         self.model_metrics = {}
         self.predictions = {}
         self.cv_results = {}
+        self.best_model_name = None
+        self._compiled_rf = None
+        self._ml_data_cache = None
+        self._splits = {}
         
         # Output folder for results
         self.output_folder = Path("app/static/img/predictions")
         self.output_folder.mkdir(parents=True, exist_ok=True)
         
+        # Trained models persisted across runs (kept out of the static folder,
+        # anchored on the project root rather than the working directory)
+        self.model_cache_folder = Path(__file__).resolve().parents[2] / ".cache" / "models"
+        
         # Model configurations
         self.model_configs = {
-            'prophet': {'enabled': PROPHET_AVAILABLE},
-            'arima': {'enabled': STATSMODELS_AVAILABLE},
+            # use_statsforecast: MSTL/AutoETS seasonal baseline instead of Prophet (much faster)
+            'prophet': {
+                'enabled': PROPHET_AVAILABLE or STATSFORECAST_AVAILABLE,
+                'use_statsforecast': STATSFORECAST_AVAILABLE
+            },
+            'arima': {'enabled': STATSFORECAST_AVAILABLE or STATSMODELS_AVAILABLE},
             'random_forest': {'enabled': True},
             'linear_regression': {'enabled': True}
         }
     
+    def _get_ml_data(self):
+        """
+        Prepared ML datasets, computed once per service instance
+        """
+        if self._ml_data_cache is None:
+            ml_data = self.preprocessor.prepare_ml_datasets()
+            
+            # float32 features/target halve memory traffic for the sklearn fits
+            ml_data['X'] = ml_data['X'].astype(np.float32, copy=False)
+            ml_data['y'] = ml_data['y'].astype(np.float32, copy=False)
+            
+            self._ml_data_cache = ml_data
+        return self._ml_data_cache
+    
+    def _get_splits(self, n_samples, n_splits):
+        """
+        TimeSeriesSplit (train, test) index arrays, materialized once per size
+        """
+        key = (n_samples, n_splits)
+        if key not in self._splits:
+            self._splits[key] = list(TimeSeriesSplit(n_splits=n_splits).split(np.empty((n_samples, 1))))
+        return self._splits[key]
+    
     def time_series_split_validation(self, X, y, dates, n_splits=5):
         """
         Perform time series cross-validation
         """
         logger.info(f"=== VALIDATION CROISÉE TEMPORELLE ({n_splits} splits) ===")
         
-        tscv = TimeSeriesSplit(n_splits=n_splits)
+        # Index NumPy arrays directly instead of going through pandas .iloc per fold
+        X_np = np.asarray(X)
+        y_np = np.asarray(y)
         cv_scores = []
         
-        for fold, (train_idx, test_idx) in enumerate(tscv.split(X)):
-            X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
-            y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
+        for fold, (train_idx, test_idx) in enumerate(self._get_splits(len(X_np), n_splits)):
+            X_train, X_test = X_np[train_idx], X_np[test_idx]
+            y_train, y_test = y_np[train_idx], y_np[test_idx]
             
             # Train a simple model for validation
-            model = RandomForestRegressor(n_estimators=50, random_state=42)
+            model = RandomForestRegressor(n_estimators=50, random_state=42, n_jobs=-1)
             model.fit(X_train, y_train)
             y_pred = model.predict(X_test)
             
-            r2 = r2_score(y_test, y_pred)
-            mae = mean_absolute_error(y_test, y_pred)
+            r2, mae = _fused_metrics(y_test, y_pred)
             
             cv_scores.append({'fold': fold, 'r2': r2, 'mae': mae})
             
@@ -104,10 +190,22 @@ class AdvancedPredictionService:
         """
         Train Facebook Prophet model
         """
-        if not PROPHET_AVAILABLE or Prophet is None:
+        if self.model_configs['prophet'].get('use_statsforecast') and STATSFORECAST_AVAILABLE:
+            mstl_result = self.train_mstl_model(data)
+            if mstl_result is not None:
+                return mstl_result
+            logger.warning("⚠️ MSTL failed - falling back to Prophet")
+        
+        if not PROPHET_AVAILABLE:
             logger.warning("⚠️ Prophet not available - skipping Prophet model")
             return None
         
+        try:
+            from prophet import Prophet
+        except Exception as e:
+            logger.warning(f"⚠️ Prophet not available: {e} - skipping Prophet model")
+            return None
+        
         logger.info("=== ENTRAÎNEMENT PROPHET ===")
         
         try:
@@ -162,30 +260,87 @@ class AdvancedPredictionService:
             logger.error(f"❌ Error training Prophet: {e}")
             return None
     
+    def train_mstl_model(self, data):
+        """
+        Train StatsForecast MSTL (quarterly + yearly seasonality, non-seasonal AutoETS trend)
+        """
+        logger.info("=== ENTRAÎNEMENT MSTL ===")
+        
+        try:
+            y_true = np.asarray(data['y'], dtype=np.float64)
+            
+            # The trend forecaster must not model seasonality itself (MSTL handles it)
+            model = MSTL(season_length=[3, 12], trend_forecaster=AutoETS(model='ZZN'))
+            model.fit(y_true)
+            
+            # In-sample predictions for evaluation
+            y_pred = model.predict_in_sample()['fitted']
+            
+            r2 = r2_score(y_true, y_pred)
+            mae = mean_absolute_error(y_true, y_pred)
+            rmse = np.sqrt(mean_squared_error(y_true, y_pred))
+            
+            metrics = {
+                'r2_score': r2,
+                'mae': mae,
+                'rmse': rmse,
+                'model_type': 'mstl'
+            }
+            
+            logger.info(f"✅ MSTL trained - R²: {r2:.3f}, MAE: {mae:.2f}")
+            
+            return {
+                'model': model,
+                'metrics': metrics
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ Error training MSTL: {e}")
+            return None
+    
     def train_arima_model(self, data, order=(2,1,2)):
         """
-        Train ARIMA model
+        Train ARIMA model (numba-compiled AutoARIMA when statsforecast is installed,
+        statsmodels ARIMA with the given order otherwise)
         """
-        if not STATSMODELS_AVAILABLE:
+        if not (STATSFORECAST_AVAILABLE or STATSMODELS_AVAILABLE):
             logger.warning("⚠️ Statsmodels not available")
             return None
         
-        logger.info(f"=== ENTRAÎNEMENT ARIMA{order} ===")
+        if STATSFORECAST_AVAILABLE:
+            logger.info("=== ENTRAÎNEMENT AUTOARIMA ===")
+        else:
+            logger.info(f"=== ENTRAÎNEMENT ARIMA{order} ===")
         
         try:
-            # Prepare time series data
-            ts_data = pd.Series(data['y'].values, index=data['dates'])
-            ts_data = ts_data.asfreq('MS')  # Monthly start frequency
-            
-            # Handle missing values
-            ts_data = ts_data.ffill()
+            # Prepare time series data on a monthly start grid, forward-filling gaps in one pass
+            monthly_index = pd.date_range(data['dates'].min(), data['dates'].max(), freq='MS')
+            ts_data = pd.Series(data['y'].values, index=pd.DatetimeIndex(data['dates']))
+            ts_data = ts_data.reindex(monthly_index, method='ffill')
             
-            # Fit ARIMA model
-            model = ARIMA(ts_data, order=order)
-            fitted_model = model.fit()
+            if STATSFORECAST_AVAILABLE:
+                # Fit AutoARIMA (automatic order selection, yearly seasonality)
+                fitted_model = AutoARIMA(season_length=12)
+                fitted_model.fit(ts_data.values.astype(np.float64))
+                
+                y_pred = fitted_model.predict_in_sample()['fitted']
+                residuals = ts_data.values - y_pred
+                aic = fitted_model.model_['aic']
+                bic = fitted_model.model_['bic']
+                
+                # arma = (p, q, P, Q, season, d, D)
+                arma = fitted_model.model_['arma']
+                order = (arma[0], arma[5], arma[1])
+            else:
+                # Fit ARIMA model
+                model = ARIMA(ts_data, order=order)
+                fitted_model = model.fit()
+                
+                y_pred = fitted_model.fittedvalues
+                residuals = fitted_model.resid
+                aic = fitted_model.aic
+                bic = fitted_model.bic
             
-            # Make predictions
-            y_pred = fitted_model.fittedvalues
             y_true = ts_data.values
             
             # Calculate metrics
@@ -193,28 +348,27 @@ class AdvancedPredictionService:
             mae = mean_absolute_error(y_true, y_pred)
             rmse = np.sqrt(mean_squared_error(y_true, y_pred))
             
-            # Model diagnostics
-            ljung_box = acorr_ljungbox(fitted_model.resid, lags=10, return_df=True)
-            aic = fitted_model.aic
-            bic = fitted_model.bic
-            
             metrics = {
                 'r2_score': r2,
                 'mae': mae,
                 'rmse': rmse,
                 'aic': aic,
                 'bic': bic,
-                'ljung_box_pvalue': ljung_box['lb_pvalue'].iloc[0],
                 'model_type': 'arima',
                 'order': order
             }
             
-            logger.info(f"✅ ARIMA trained - R²: {r2:.3f}, MAE: {mae:.2f}, AIC: {aic:.1f}")
+            # Model diagnostics
+            if STATSMODELS_AVAILABLE:
+                ljung_box = acorr_ljungbox(residuals, lags=10, return_df=True)
+                metrics['ljung_box_pvalue'] = ljung_box['lb_pvalue'].iloc[0]
+            
+            logger.info(f"✅ ARIMA{order} trained - R²: {r2:.3f}, MAE: {mae:.2f}, AIC: {aic:.1f}")
             
             return {
                 'model': fitted_model,
                 'metrics': metrics,
-                'residuals': fitted_model.resid
+                'residuals': residuals
             }
             
         except Exception as e:
@@ -233,50 +387,41 @@ class AdvancedPredictionService:
             'min_samples_split': [2, 5, 10]
         }
         
-        best_score = -np.inf
-        best_params = None
-        best_model = None
-        
-        # Simple grid search with time series split
-        tscv = TimeSeriesSplit(n_splits=3)
-        
-        for n_est in param_grid['n_estimators']:
-            for max_d in param_grid['max_depth']:
-                for min_split in param_grid['min_samples_split']:
-                    
-                    scores = []
-                    for train_idx, test_idx in tscv.split(X):
-                        X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
-                        y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
-                        
-                        model = RandomForestRegressor(
-                            n_estimators=n_est,
-                            max_depth=max_d,
-                            min_samples_split=min_split,
-                            random_state=42
-                        )
-                        model.fit(X_train, y_train)
-                        y_pred = model.predict(X_test)
-                        scores.append(r2_score(y_test, y_pred))
-                    
-                    avg_score = np.mean(scores)
-                    
-                    if avg_score > best_score:
-                        best_score = avg_score
-                        best_params = {
-                            'n_estimators': n_est,
-                            'max_depth': max_d,
-                            'min_samples_split': min_split
-                        }
-        
-        # Train final model with best parameters
-        best_model = RandomForestRegressor(**best_params, random_state=42)
-        best_model.fit(X, y)
+        # Parallel grid search with time series split
+        grid_search = GridSearchCV(
+            RandomForestRegressor(random_state=42, n_jobs=1),
+            param_grid,
+            cv=self._get_splits(len(X), 3),
+            scoring='r2',
+            n_jobs=-1,
+            refit=True
+        )
+        grid_search.fit(X, y)
+        
+        best_model = grid_search.best_estimator_
+        best_params = grid_search.best_params_
+        best_score = grid_search.best_score_
+        
+        # Compile the fitted forest to native code for the hot predict calls
+        self._compiled_rf = None
+        if COMPILEDTREES_AVAILABLE:
+            try:
+                self._compiled_rf = CompiledRegressionPredictor(best_model)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not compile random forest, using sklearn predict: {e}")
         
         logger.info(f"✅ Best RF params: {best_params}, Score: {best_score:.3f}")
         
         return best_model, best_params, best_score
     
+    def _predict_rf(self, model, X):
+        """
+        Predict with the compiled forest when available, sklearn otherwise
+        """
+        if self._compiled_rf is not None:
+            return self._compiled_rf.predict(np.asarray(X, dtype=np.float32))
+        return model.predict(X)
+    
     def train_all_advanced_models(self):
         """
         Train all available models with advanced features
@@ -284,40 +429,75 @@ class AdvancedPredictionService:
         logger.info("=== ENTRAÎNEMENT MODÈLES AVANCÉS ===")
         
         # Get prepared data
-        ml_data = self.preprocessor.prepare_ml_datasets()
+        ml_data = self._get_ml_data()
         
         if len(ml_data['X']) < 10:
             logger.error("❌ Not enough data for training")
             return None
         
+        # Reuse models trained on identical data in a previous run
+        cache_path = self._model_cache_path(ml_data)
+        results = self._load_cached_models(cache_path)
+        if results is None:
+            results = self._train_models(ml_data)
+            self._save_cached_models(results, cache_path)
+        
+        # Store results
+        self.models = results
+        self.model_metrics = {k: v['metrics'] for k, v in results.items() if 'metrics' in v}
+        
+        # Find best model
+        best_model_name = max(self.model_metrics.keys(), 
+                             key=lambda k: self.model_metrics[k]['r2_score'])
+        self.best_model_name = best_model_name
+        
+        logger.info(f"🏆 Best model: {best_model_name} (R²={self.model_metrics[best_model_name]['r2_score']:.3f})")
+        
+        return results
+    
+    def _train_models(self, ml_data):
+        """
+        Cross-validate and fit every enabled model on the prepared data
+        """
         # Perform time series cross-validation
         self.time_series_split_validation(ml_data['X'], ml_data['y'], ml_data['dates'])
         
-        results = {}
-        
-        # 1. Prophet model
+        # Independent fits: 1. Prophet, 2. ARIMA, 3. tuned Random Forest, 4. scaled LR
+        tasks = {}
         if self.model_configs['prophet']['enabled']:
-            prophet_result = self.train_prophet_model(ml_data)
-            if prophet_result:
-                results['prophet'] = prophet_result
-        
-        # 2. ARIMA model
+            tasks['prophet'] = self.train_prophet_model
         if self.model_configs['arima']['enabled']:
-            arima_result = self.train_arima_model(ml_data)
-            if arima_result:
-                results['arima'] = arima_result
-        
-        # 3. Enhanced Random Forest with hyperparameter tuning
+            tasks['arima'] = self.train_arima_model
+        tasks['random_forest_tuned'] = self.train_tuned_rf_model
+        tasks['linear_regression_scaled'] = self.train_scaled_lr_model
+        
+        # Threads: Prophet waits on its Stan subprocess and the grid search
+        # fans out to its own joblib workers, so the GIL is not the bottleneck
+        completed = {}
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {executor.submit(train, ml_data): name for name, train in tasks.items()}
+            for future in as_completed(futures):
+                result = future.result()
+                if result:
+                    completed[futures[future]] = result
+        
+        # Keep the declaration order (used to break ties between models)
+        return {name: completed[name] for name in tasks if name in completed}
+    
+    def train_tuned_rf_model(self, data):
+        """
+        Train Random Forest with hyperparameter tuning
+        """
         try:
-            rf_model, rf_params, rf_score = self.hyperparameter_tuning_rf(ml_data['X'], ml_data['y'])
-            y_pred = rf_model.predict(ml_data['X'])
+            rf_model, rf_params, rf_score = self.hyperparameter_tuning_rf(data['X'], data['y'])
+            y_pred = self._predict_rf(rf_model, data['X'])
             
-            results['random_forest_tuned'] = {
+            return {
                 'model': rf_model,
                 'metrics': {
-                    'r2_score': r2_score(ml_data['y'], y_pred),
-                    'mae': mean_absolute_error(ml_data['y'], y_pred),
-                    'rmse': np.sqrt(mean_squared_error(ml_data['y'], y_pred)),
+                    'r2_score': r2_score(data['y'], y_pred),
+                    'mae': mean_absolute_error(data['y'], y_pred),
+                    'rmse': np.sqrt(mean_squared_error(data['y'], y_pred)),
                     'model_type': 'random_forest_tuned',
                     'best_params': rf_params
                 }
@@ -325,41 +505,90 @@ class AdvancedPredictionService:
             
         except Exception as e:
             logger.error(f"❌ Error training tuned RF: {e}")
-        
-        # 4. Linear regression with feature scaling
+            return None
+    
+    def train_scaled_lr_model(self, data):
+        """
+        Train linear regression with feature scaling
+        """
         try:
-            scaler = StandardScaler()
-            X_scaled = scaler.fit_transform(ml_data['X'])
+            scaler = self.preprocessor.fit_scaler('linear_regression', data['X'])
+            X_scaled = scaler.transform(data['X'])
             
             lr_model = LinearRegression()
-            lr_model.fit(X_scaled, ml_data['y'])
+            lr_model.fit(X_scaled, data['y'])
             y_pred = lr_model.predict(X_scaled)
             
-            results['linear_regression_scaled'] = {
+            return {
                 'model': lr_model,
                 'scaler': scaler,
                 'metrics': {
-                    'r2_score': r2_score(ml_data['y'], y_pred),
-                    'mae': mean_absolute_error(ml_data['y'], y_pred),
-                    'rmse': np.sqrt(mean_squared_error(ml_data['y'], y_pred)),
+                    'r2_score': r2_score(data['y'], y_pred),
+                    'mae': mean_absolute_error(data['y'], y_pred),
+                    'rmse': np.sqrt(mean_squared_error(data['y'], y_pred)),
                     'model_type': 'linear_regression_scaled'
                 }
             }
             
         except Exception as e:
             logger.error(f"❌ Error training scaled LR: {e}")
+            return None
+    
+    def _model_cache_path(self, ml_data):
+        """
+        Cache file keyed on the training data, the model configurations and the training code
+        """
+        digest = hashlib.sha1()
+        digest.update(pd.util.hash_pandas_object(ml_data['X'], index=False).values.tobytes())
+        digest.update(pd.util.hash_pandas_object(ml_data['y'], index=False).values.tobytes())
+        digest.update(json.dumps(self.model_configs, sort_keys=True).encode('utf-8'))
+        digest.update(_training_code_signature())
+        return self.model_cache_folder / f"models_{digest.hexdigest()[:16]}.joblib"
+    
+    def _load_cached_models(self, cache_path):
+        """
+        Load previously trained models, or None if there is no usable cache
+        """
+        if not cache_path.exists():
+            return None
         
-        # Store results
-        self.models = results
-        self.model_metrics = {k: v['metrics'] for k, v in results.items() if 'metrics' in v}
-        
-        # Find best model
-        best_model_name = max(self.model_metrics.keys(), 
-                             key=lambda k: self.model_metrics[k]['r2_score'])
-        
-        logger.info(f"🏆 Best model: {best_model_name} (R²={self.model_metrics[best_model_name]['r2_score']:.3f})")
-        
-        return results
+        try:
+            cached = joblib.load(cache_path)
+            results = cached['models']
+            
+            # Prophet is stored as JSON (its Stan backend does not pickle reliably)
+            if 'prophet_json' in results.get('prophet', {}):
+                from prophet.serialize import model_from_json
+                results['prophet']['model'] = model_from_json(results['prophet'].pop('prophet_json'))
+            
+            self.cv_results = cached['cv_results']
+            logger.info(f"⚡ Trained models loaded from cache: {cache_path.name}")
+            return results
+            
+        except Exception as e:
+            logger.warning(f"⚠️ Model cache unusable, retraining: {e}")
+            return None
+    
+    def _save_cached_models(self, results, cache_path):
+        """
+        Persist trained models and CV results for the next run
+        """
+        try:
+            to_save = dict(results)
+            if type(results.get('prophet', {}).get('model')).__name__ == 'Prophet':
+                from prophet.serialize import model_to_json
+                to_save['prophet'] = {k: v for k, v in results['prophet'].items() if k != 'model'}
+                to_save['prophet']['prophet_json'] = model_to_json(results['prophet']['model'])
+            
+            self.model_cache_folder.mkdir(parents=True, exist_ok=True)
+            # Keep only the current entry: older data/code versions can never be hit again
+            for old_cache in self.model_cache_folder.glob('models_*.joblib'):
+                if old_cache != cache_path:
+                    old_cache.unlink(missing_ok=True)
+            joblib.dump({'models': to_save, 'cv_results': self.cv_results}, cache_path, compress=3)
+            
+        except Exception as e:
+            logger.warning(f"⚠️ Could not cache trained models: {e}")
     
     def generate_future_predictions(self, periods=24):
         """
@@ -373,9 +602,8 @@ class AdvancedPredictionService:
         
         predictions = {}
         
-        # Get best model
-        best_model_name = max(self.model_metrics.keys(), 
-                             key=lambda k: self.model_metrics[k]['r2_score'])
+        # Get best model (selected at training time)
+        best_model_name = self.best_model_name
         
         logger.info(f"Using best model: {best_model_name}")
         
@@ -394,22 +622,42 @@ class AdvancedPredictionService:
         """Predict with Prophet model"""
         model = self.models['prophet']['model']
         
+        if STATSFORECAST_AVAILABLE and isinstance(model, MSTL):
+            return self._predict_with_mstl(model, periods)
+        
         # Create future dataframe
         future = model.make_future_dataframe(periods=periods, freq='MS')
         forecast = model.predict(future)
         
-        # Extract future predictions
-        future_start = len(forecast) - periods
-        future_predictions = forecast.iloc[future_start:]['yhat'].values
-        future_dates = forecast.iloc[future_start:]['ds'].values
+        # Extract future predictions (single slice of the forecast frame)
+        tail = forecast.iloc[len(forecast) - periods:]
         
         return {
             'model_name': 'prophet',
-            'predictions': future_predictions.tolist(),
-            'dates': [pd.to_datetime(d).strftime('%Y-%m') for d in future_dates],
+            'predictions': tail['yhat'].to_numpy().tolist(),
+            'dates': tail['ds'].dt.strftime('%Y-%m').tolist(),
             'confidence_intervals': {
-                'lower': forecast.iloc[future_start:]['yhat_lower'].values.tolist(),
-                'upper': forecast.iloc[future_start:]['yhat_upper'].values.tolist()
+                'lower': tail['yhat_lower'].to_numpy().tolist(),
+                'upper': tail['yhat_upper'].to_numpy().tolist()
+            }
+        }
+    
+    def _predict_with_mstl(self, model, periods):
+        """Predict with the StatsForecast MSTL seasonal baseline"""
+        forecast = model.predict(h=periods, level=[95])
+        
+        # Generate future dates
+        last_date = self._get_ml_data()['dates'].max()
+        future_dates = pd.date_range(start=last_date + pd.DateOffset(months=1), 
+                                   periods=periods, freq='MS')
+        
+        return {
+            'model_name': 'mstl',
+            'predictions': forecast['mean'].tolist(),
+            'dates': future_dates.strftime('%Y-%m').tolist(),
+            'confidence_intervals': {
+                'lower': forecast['lo-95'].tolist(),
+                'upper': forecast['hi-95'].tolist()
             }
         }
     
@@ -418,8 +666,17 @@ class AdvancedPredictionService:
         model = self.models['arima']['model']
         
         # Generate future predictions
-        forecast = model.forecast(steps=periods)
-        conf_int = model.get_forecast(steps=periods).conf_int()
+        if STATSFORECAST_AVAILABLE and isinstance(model, AutoARIMA):
+            forecast_result = model.predict(h=periods, level=[95])
+            forecast = forecast_result['mean']
+            lower = forecast_result['lo-95']
+            upper = forecast_result['hi-95']
+        else:
+            forecast_result = model.get_forecast(steps=periods)
+            forecast = forecast_result.predicted_mean
+            conf_int = forecast_result.conf_int()
+            lower = conf_int.iloc[:, 0]
+            upper = conf_int.iloc[:, 1]
         
         # Generate future dates
         last_date = self.preprocessor.df_features['date'].max()
@@ -429,32 +686,31 @@ class AdvancedPredictionService:
         return {
             'model_name': 'arima',
             'predictions': forecast.tolist(),
-            'dates': [d.strftime('%Y-%m') for d in future_dates],
+            'dates': future_dates.strftime('%Y-%m').tolist(),
             'confidence_intervals': {
-                'lower': conf_int.iloc[:, 0].tolist(),
-                'upper': conf_int.iloc[:, 1].tolist()
+                'lower': lower.tolist(),
+                'upper': upper.tolist()
             }
         }
     
     def _predict_with_ml_model(self, model_name, periods):
         """Predict with ML models using trend extrapolation"""
         # Simple trend-based prediction for ML models
-        ml_data = self.preprocessor.prepare_ml_datasets()
+        ml_data = self._get_ml_data()
         last_values = ml_data['y'].tail(12).values  # Last 12 months
         
-        # Simple trend calculation
-        trend = np.polyfit(range(len(last_values)), last_values, 1)[0]
+        # Simple trend calculation (closed-form least-squares slope)
+        x = np.arange(last_values.size, dtype=np.float64)
+        x_centered = x - x.mean()
+        trend = (x_centered * (last_values - last_values.mean())).sum() / (x_centered ** 2).sum()
         
-        # Generate future predictions
-        future_predictions = []
+        # Generate future predictions (vectorized over the horizon)
         last_value = last_values[-1]
+        steps = np.arange(periods)
         
-        for i in range(periods):
-            next_pred = last_value + trend * (i + 1)
-            # Add some seasonal variation
-            seasonal_factor = 1 + 0.2 * np.sin(2 * np.pi * i / 12)
-            next_pred *= seasonal_factor
-            future_predictions.append(max(1, next_pred))  # Ensure positive
+        # Linear trend with some seasonal variation, kept positive
+        seasonal_factor = 1 + 0.2 * np.sin(2 * np.pi * steps / 12)
+        future_predictions = np.maximum(1, (last_value + trend * (steps + 1)) * seasonal_factor)
         
         # Generate future dates
         last_date = ml_data['dates'].max()
@@ -463,11 +719,11 @@ class AdvancedPredictionService:
         
         return {
             'model_name': model_name,
-            'predictions': future_predictions,
-            'dates': [d.strftime('%Y-%m') for d in future_dates],
+            'predictions': future_predictions.tolist(),
+            'dates': future_dates.strftime('%Y-%m').tolist(),
             'confidence_intervals': {
-                'lower': [p * 0.8 for p in future_predictions],
-                'upper': [p * 1.2 for p in future_predictions]
+                'lower': (future_predictions * 0.8).tolist(),
+                'upper': (future_predictions * 1.2).tolist()
             }
         }
     
@@ -478,28 +734,25 @@ class AdvancedPredictionService:
         if not self.model_metrics:
             return {}
         
-        comparison = {}
-        for model_name, metrics in self.model_metrics.items():
-            r2 = metrics['r2_score']
-            
-            # Determine quality rating
-            if r2 > 0.8:
-                quality = 'Excellent'
-            elif r2 > 0.5:
-                quality = 'Bon'
-            elif r2 > 0.2:
-                quality = 'Moyen'
-            else:
-                quality = 'Faible'
-            
-            comparison[model_name] = {
-                'r2_score': r2,
-                'mae': metrics['mae'],
-                'quality': quality,
-                'model_type': metrics['model_type']
-            }
+        names = list(self.model_metrics)
+        r2_scores = np.fromiter((self.model_metrics[n]['r2_score'] for n in names), dtype=np.float64, count=len(names))
+        
+        # Determine quality rating: ]-inf, 0.2] Faible, ]0.2, 0.5] Moyen, ]0.5, 0.8] Bon, ]0.8, inf[ Excellent
+        quality_labels = np.array(['Faible', 'Moyen', 'Bon', 'Excellent'])
+        bins = np.digitize(r2_scores, [0.2, 0.5, 0.8], right=True)
+        # digitize puts NaN in the last bin: an undefined R² is rated 'Faible'
+        bins[np.isnan(r2_scores)] = 0
+        qualities = quality_labels[bins]
         
-        return comparison
+        return {
+            name: {
+                'r2_score': self.model_metrics[name]['r2_score'],
+                'mae': self.model_metrics[name]['mae'],
+                'quality': str(quality),
+                'model_type': self.model_metrics[name]['model_type']
+            }
+            for name, quality in zip(names, qualities)
+        }
     
     def export_results(self):
         """
@@ -515,8 +768,15 @@ class AdvancedPredictionService:
         
         # Save to file
         results_path = self.output_folder / 'advanced_results.json'
-        with open(results_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+        if ORJSON_AVAILABLE:
+            results_path.write_bytes(orjson.dumps(
+                results,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str
+            ))
+        else:
+            with open(results_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False, default=str)
         
         logger.info(f"✅ Results exported to {results_path}")
         
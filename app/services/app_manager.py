@@ -24,7 +24,7 @@ class ApplicationManager:
             
     async def unregister_client(self, websocket: websockets.WebSocketServerProtocol):
         """Désenregistre un client WebSocket"""
-        self.clients.remove(websocket)
+        self.clients.discard(websocket)  # Sans KeyError si le client est déjà retiré
         if not self.clients and not self.shutdown_timer:
             self.shutdown_timer = asyncio.create_task(self.schedule_shutdown())
             
@@ -48,9 +48,18 @@ class ApplicationManager:
     async def broadcast_message(self, message: dict):
         """Envoie un message à tous les clients connectés"""
         if self.clients:
-            await asyncio.gather(
-                *[client.send(json.dumps(message)) for client in self.clients]
-            )
+            # Sérialiser une seule fois pour tous les clients
+            payload = json.dumps(message)
+            async with asyncio.TaskGroup() as tg:
+                for client in list(self.clients):
+                    tg.create_task(self._safe_send(client, payload))
+    
+    async def _safe_send(self, client: websockets.WebSocketServerProtocol, payload: str):
+        """Envoie un message à un client ; un client déconnecté n'interrompt pas les autres envois"""
+        try:
+            await client.send(payload)
+        except websockets.exceptions.ConnectionClosed:
+            self.clients.discard(client)
             
     async def loading_handler(self, websocket: websockets.WebSocketServerProtocol, path: str):
         """Gère la connexion WebSocket pour l'écran de chargement"""
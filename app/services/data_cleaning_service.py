@@ -4,11 +4,116 @@
 
 import pandas as pd
 import re
+import time
 from datetime import datetime, date
+from functools import wraps
 import logging
 from typing import Dict, List, Tuple, Optional
 import numpy as np
 
+# Patterns compilés une seule fois au chargement du module
+# Une seule alternation pour tous les formats de dates acceptés :
+# DD/MM/YYYY, DD-MM-YYYY, DD.MM.YYYY (même séparateur des deux côtés) ou YYYY-MM-DD
+_DATE_RE = re.compile(
+    r'(?:(?P<d>\d{1,2})(?P<sep>[/.\-])(?P<m>\d{1,2})(?P=sep)(?P<y>\d{4})'
+    r'|(?P<Y>\d{4})-(?P<M>\d{1,2})-(?P<D>\d{1,2}))'
+)
+_CANONICAL_DATE_PATTERN = re.compile(r'^(\d{2})/(\d{2})/(\d{4})$')  # Format de sortie DD/MM/YYYY
+_TIME_PATTERN = re.compile(r'^(\d{1,2}):(\d{2})$')    # HH:MM
+_CANONICAL_TIME_PATTERN = re.compile(r'^(?:[01]\d|2[0-3]):[0-5]\d$')  # HH:MM déjà normalisé
+_DURATION_PATTERN = re.compile(r'^\d{1,2}:\d{2}$')
+_NUMERO_PATTERN = re.compile(r'^\d{2}-\d{3}$')        # YY-XXX
+_NUMERO_COMPACT_PATTERN = re.compile(r'^\d{2}\d{3}$')  # YYXXX
+_NUMERO_UNDERSCORE_PATTERN = re.compile(r'^\d{2}_\d{3}$')  # YY_XXX
+_WHITESPACE_RE = re.compile(r'\s+')
+_AGE_INTEGER_RE = re.compile(r'[+-]?\d+')  # Âge entier une fois " ans" retiré ("34 ans" -> 34)
+_PHONE_INVALID_CHARS_RE = re.compile(r'[^\d\s\.\-]')
+
+
+def _dedup_apply(series: pd.Series, func, alerts: Optional[List[str]] = None) -> pd.Series:
+    """
+    Applique func une seule fois par valeur distincte non nulle, puis projette le résultat sur la série
+    
+    Si alerts est fourni (liste que func complète), les alertes émises pour une valeur sont
+    répétées pour chaque ligne portant cette valeur, dans l'ordre des lignes : une alerte par ligne.
+    """
+    lookup = {}
+    value_alerts = {}
+    for value in series.dropna().unique():
+        start = len(alerts) if alerts is not None else 0
+        lookup[value] = func(value)
+        if alerts is not None and len(alerts) > start:
+            value_alerts[value] = alerts[start:]
+            del alerts[start:]
+    
+    if value_alerts:
+        for value in series[series.isin(list(value_alerts))]:
+            alerts.extend(value_alerts[value])
+    
+    # Les valeurs manquantes (absentes du dictionnaire) deviennent NaN
+    return series.map(lookup)
+
+
+def _hhmm_to_minutes(series: pd.Series) -> np.ndarray:
+    """Convertit une série d'heures HH:MM en minutes depuis minuit (NaN si invalide)"""
+    parts = series.astype(str).str.strip().str.extract(_TIME_PATTERN)
+    hours = pd.to_numeric(parts[0], errors='coerce').to_numpy(dtype=np.float64)
+    minutes = pd.to_numeric(parts[1], errors='coerce').to_numpy(dtype=np.float64)
+    return hours * 60 + minutes
+
+
+def _all_match(series: pd.Series, pattern: re.Pattern) -> bool:
+    """Vrai si la série est de type texte et que toutes ses valeurs non nulles respectent déjà le pattern"""
+    # is_string_dtype est vrai pour toute colonne objet : vérifier que les valeurs sont bien du texte
+    # (heures datetime.time, numéros entiers... lus depuis Excel -> chemin de nettoyage complet)
+    if pd.api.types.infer_dtype(series, skipna=True) != 'string':
+        return False
+    return bool(series.dropna().str.match(pattern).all())
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> Optional[int]:
+    """Empreinte du contenu d'un DataFrame (colonnes + valeurs), None si non hachable"""
+    try:
+        values_hash = int(pd.util.hash_pandas_object(df, index=True).sum())
+    except TypeError:
+        # Colonnes objet contenant des valeurs non hachables (listes, dicts...)
+        try:
+            values_hash = int(pd.util.hash_pandas_object(df.astype(str), index=True).sum())
+        except Exception:
+            return None
+    return hash((tuple(map(str, df.columns)), values_hash))
+
+
+def _cached_cleaning(method):
+    """
+    Met en cache le résultat (DataFrame nettoyé, alertes) d'une méthode de nettoyage,
+    indexé par l'empreinte du DataFrame d'entrée et valable cache_duration secondes
+    """
+    @wraps(method)
+    def wrapper(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
+        fingerprint = _frame_fingerprint(df) if not df.empty else None
+        if fingerprint is None:
+            return method(self, df)
+        
+        now = time.time()
+        key = (method.__name__, fingerprint)
+        if key in self._cache and now - self._cache_timestamps[key] < self.cache_duration:
+            df_clean, alerts = self._cache[key]
+            # Copie superficielle : les ajouts de colonnes de l'appelant ne polluent pas le cache
+            return df_clean.copy(deep=False), list(alerts)
+        
+        # Éviction des entrées expirées
+        for expired in [k for k, ts in self._cache_timestamps.items() if now - ts >= self.cache_duration]:
+            self._cache.pop(expired, None)
+            self._cache_timestamps.pop(expired, None)
+        
+        df_clean, alerts = method(self, df)
+        self._cache[key] = (df_clean, list(alerts))
+        self._cache_timestamps[key] = now
+        return df_clean.copy(deep=False), alerts
+    
+    return wrapper
+
 class DataCleaningService:
     """
     Service spécialisé pour le nettoyage et la validation des données
@@ -21,21 +126,16 @@ class DataCleaningService:
     - Cache des données nettoyées pour optimiser les performances
     """
     
+    # Version des règles de nettoyage : à incrémenter quand le résultat du nettoyage change
+    # (invalide les caches disque des données nettoyées, même sans modification des fichiers Excel)
+    CLEANING_VERSION = 2
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self._cache = {}
         self._cache_timestamps = {}
         self.cache_duration = 300  # 5 minutes de cache
-        
-        # Patterns pour la validation
-        self.date_patterns = [
-            r'(\d{1,2})/(\d{1,2})/(\d{4})',      # DD/MM/YYYY ou D/M/YYYY
-            r'(\d{1,2})-(\d{1,2})-(\d{4})',      # DD-MM-YYYY ou D-M-YYYY
-            r'(\d{4})-(\d{1,2})-(\d{1,2})',      # YYYY-MM-DD
-            r'(\d{1,2})\.(\d{1,2})\.(\d{4})',    # DD.MM.YYYY
-        ]
-        
-        self.time_pattern = r'^(\d{1,2}):(\d{2})$'  # HH:MM
+        self._numero_sets = {}  # colonne -> (DataFrame source, ensemble des numéros)
         
         # Messages d'erreur standardisés
         self.error_messages = {
@@ -45,6 +145,17 @@ class DataCleaningService:
             'format_corrected': 'Format de données corrigé automatiquement'
         }
     
+    @property
+    def date_patterns(self) -> List[str]:
+        """Patterns de dates acceptés (sources des patterns compilés du module)"""
+        return [_DATE_RE.pattern]
+    
+    @property
+    def time_pattern(self) -> str:
+        """Pattern d'heure HH:MM"""
+        return _TIME_PATTERN.pattern
+    
+    @_cached_cleaning
     def clean_inscription_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
         """
         Nettoie les données d'inscription
@@ -58,7 +169,9 @@ class DataCleaningService:
         if df.empty:
             return df, ['Aucune donnée d\'inscription trouvée']
         
-        df_clean = df.copy()
+        # Copie superficielle : chaque colonne nettoyée est réassignée (df_clean[col] = ...),
+        # ce qui remplace la colonne sans toucher au DataFrame source (pandas >= 2)
+        df_clean = df.copy(deep=False)
         alerts = []
         
         # 1. Nettoyage des dates
@@ -84,12 +197,14 @@ class DataCleaningService:
             alerts.extend(age_alerts)
         
         # 5. Nettoyage des coordonnées
-        for col in ['Téléphone', 'Email']:
-            if col in df_clean.columns:
-                df_clean[col] = self._clean_contact_column(df_clean[col], col)
+        if 'Téléphone' in df_clean.columns:
+            df_clean['Téléphone'] = self._clean_phone_column(df_clean['Téléphone'])
+        if 'Email' in df_clean.columns:
+            df_clean['Email'] = self._clean_email_column(df_clean['Email'])
         
         return df_clean, alerts
     
+    @_cached_cleaning
     def clean_presence_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
         """
         Nettoie les données de présence
@@ -103,7 +218,9 @@ class DataCleaningService:
         if df.empty:
             return df, ['Aucune donnée de présence trouvée']
         
-        df_clean = df.copy()
+        # Copie superficielle : chaque colonne nettoyée est réassignée (df_clean[col] = ...),
+        # ce qui remplace la colonne sans toucher au DataFrame source (pandas >= 2)
+        df_clean = df.copy(deep=False)
         alerts = []
         
         # 1. Nettoyage des dates
@@ -140,31 +257,37 @@ class DataCleaningService:
     def _clean_date_column(self, series: pd.Series, column_name: str) -> Tuple[pd.Series, List[str]]:
         """Nettoie une colonne de dates en format français"""
         alerts = []
-        cleaned_series = series.copy()
         
         def parse_french_date(date_str):
             """Parse une date en format français avec plusieurs patterns"""
             if pd.isna(date_str) or date_str == '':
                 return None
+            
+            # Dates déjà typées (Timestamp, datetime, date) : pas besoin de regex.
+            # Comme le repli pandas, aucune borne d'années ne s'applique à une vraie date.
+            if isinstance(date_str, date):
+                return date_str.strftime('%d/%m/%Y')
                 
             date_str = str(date_str).strip()
             
-            # Pattern principal : DD/MM/YYYY
-            for pattern in self.date_patterns:
-                match = re.match(pattern, date_str)
-                if match:
-                    try:
-                        groups = match.groups()
-                        if pattern.startswith(r'(\d{4})'):  # YYYY-MM-DD
-                            year, month, day = map(int, groups)
-                        else:  # DD/MM/YYYY, DD-MM-YYYY, DD.MM.YYYY
-                            day, month, year = map(int, groups)
-                        
-                        # Validation des valeurs
-                        if 1 <= month <= 12 and 1 <= day <= 31 and 1900 <= year <= 2030:
-                            return f"{day:02d}/{month:02d}/{year}"
-                    except ValueError:
-                        continue
+            # Chemin rapide : date déjà au format de sortie (données déjà nettoyées)
+            canonical = _CANONICAL_DATE_PATTERN.match(date_str)
+            if canonical:
+                day, month, year = map(int, canonical.groups())
+                if 1 <= month <= 12 and 1 <= day <= 31 and 1900 <= year <= 2030:
+                    return date_str
+            
+            # Formats reconnus : un seul passage dans le moteur de regex
+            match = _DATE_RE.match(date_str)
+            if match:
+                if match.group('Y'):  # YYYY-MM-DD
+                    year, month, day = int(match.group('Y')), int(match.group('M')), int(match.group('D'))
+                else:  # DD/MM/YYYY, DD-MM-YYYY, DD.MM.YYYY
+                    day, month, year = int(match.group('d')), int(match.group('m')), int(match.group('y'))
+                
+                # Validation des valeurs
+                if 1 <= month <= 12 and 1 <= day <= 31 and 1900 <= year <= 2030:
+                    return f"{day:02d}/{month:02d}/{year}"
             
             # Si aucun pattern ne fonctionne, essayer pandas
             try:
@@ -177,21 +300,24 @@ class DataCleaningService:
             alerts.append(f"Date invalide dans {column_name}: '{date_str}'")
             return None
         
-        # Appliquer le nettoyage
-        for idx in series.index:
-            if not pd.isna(series[idx]):
-                cleaned_date = parse_french_date(series[idx])
-                if cleaned_date:
-                    cleaned_series[idx] = cleaned_date
-                else:
-                    cleaned_series[idx] = None
+        # Colonne déjà typée en dates : formatage direct, sans passer par le parsing texte
+        # (même règle que pour les dates typées isolées : pas de borne d'années)
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series.dt.strftime('%d/%m/%Y'), alerts
+        
+        # Appliquer le nettoyage une seule fois par valeur distincte (les dates se répètent beaucoup)
+        not_null = series.notna()
+        if not not_null.any():
+            return series, alerts
+        
+        # Une alerte par ligne invalide (et non par valeur distincte)
+        cleaned_series = _dedup_apply(series, parse_french_date, alerts)
         
         return cleaned_series, alerts
     
     def _clean_time_column(self, series: pd.Series, column_name: str) -> Tuple[pd.Series, List[str]]:
         """Nettoie une colonne d'heures (format HH:MM)"""
         alerts = []
-        cleaned_series = series.copy()
         
         def parse_time(time_str):
             """Parse une heure en format HH:MM"""
@@ -201,7 +327,7 @@ class DataCleaningService:
             time_str = str(time_str).strip()
             
             # Pattern HH:MM
-            match = re.match(self.time_pattern, time_str)
+            match = _TIME_PATTERN.match(time_str)
             if match:
                 hours, minutes = map(int, match.groups())
                 if 0 <= hours <= 23 and 0 <= minutes <= 59:
@@ -222,18 +348,26 @@ class DataCleaningService:
             alerts.append(f"Heure invalide dans {column_name}: '{time_str}'")
             return None
         
-        # Appliquer le nettoyage
-        for idx in series.index:
-            if not pd.isna(series[idx]):
-                cleaned_time = parse_time(series[idx])
-                cleaned_series[idx] = cleaned_time
+        # Colonne déjà propre : rien à faire
+        if _all_match(series, _CANONICAL_TIME_PATTERN):
+            return series, alerts
         
-        return cleaned_series, alerts
+        # Pré-filtre vectorisé : seules les heures qui ne sont pas déjà en HH:MM passent par parse_time
+        not_null = series.notna()
+        times = series.astype(str).str.strip()
+        needs_fix = not_null & ~times.str.match(_CANONICAL_TIME_PATTERN)
+        
+        # Remplir directement le tableau de sortie (times est déjà une nouvelle allocation)
+        cleaned = times.to_numpy(dtype=object)
+        cleaned[~not_null.to_numpy()] = None
+        if needs_fix.any():
+            cleaned[needs_fix.to_numpy()] = _dedup_apply(series[needs_fix], parse_time, alerts).to_numpy(dtype=object)
+        
+        return pd.Series(cleaned, index=series.index, name=series.name), alerts
     
     def _clean_duration_column(self, series: pd.Series, column_name: str) -> Tuple[pd.Series, List[str]]:
         """Nettoie une colonne de durées"""
         alerts = []
-        cleaned_series = series.copy()
         
         def format_duration(duration):
             """Formate une durée en HH:MM"""
@@ -248,7 +382,7 @@ class DataCleaningService:
             duration_str = str(duration).strip()
             
             # Pattern HH:MM
-            if re.match(r'^\d{1,2}:\d{2}$', duration_str):
+            if _DURATION_PATTERN.match(duration_str):
                 return duration_str
             
             # Pattern timedelta ou autres formats
@@ -266,17 +400,12 @@ class DataCleaningService:
             alerts.append(f"Durée invalide dans {column_name}: '{duration}'")
             return None
         
-        # Appliquer le nettoyage
-        for idx in series.index:
-            cleaned_duration = format_duration(series[idx])
-            cleaned_series[idx] = cleaned_duration
-        
-        return cleaned_series, alerts
+        # Appliquer le nettoyage une seule fois par valeur distincte
+        return _dedup_apply(series, format_duration, alerts), alerts
     
     def _clean_numero_column(self, series: pd.Series) -> Tuple[pd.Series, List[str]]:
         """Nettoie les numéros d'apprenants (format YY-XXX)"""
         alerts = []
-        cleaned_series = series.copy()
         
         def format_numero(numero):
             """Formate un numéro d'apprenant"""
@@ -286,97 +415,98 @@ class DataCleaningService:
             numero_str = str(numero).strip()
             
             # Pattern YY-XXX
-            if re.match(r'^\d{2}-\d{3}$', numero_str):
+            if _NUMERO_PATTERN.match(numero_str):
                 return numero_str
             
             # Essayer de corriger des formats proches
-            if re.match(r'^\d{2}\d{3}$', numero_str):  # YYXXX -> YY-XXX
+            if _NUMERO_COMPACT_PATTERN.match(numero_str):  # YYXXX -> YY-XXX
                 return f"{numero_str[:2]}-{numero_str[2:]}"
             
-            if re.match(r'^\d{2}_\d{3}$', numero_str):  # YY_XXX -> YY-XXX
+            if _NUMERO_UNDERSCORE_PATTERN.match(numero_str):  # YY_XXX -> YY-XXX
                 return numero_str.replace('_', '-')
             
             alerts.append(f"Format de numéro non standard: '{numero}'")
             return numero_str  # Garder tel quel si pas de format reconnu
         
-        # Appliquer le nettoyage
-        for idx in series.index:
-            if not pd.isna(series[idx]):
-                cleaned_numero = format_numero(series[idx])
-                cleaned_series[idx] = cleaned_numero
+        # Colonne déjà propre : rien à faire
+        if _all_match(series, _NUMERO_PATTERN):
+            return series, alerts
         
-        return cleaned_series, alerts
+        # Pré-filtre vectorisé : seuls les numéros hors format YY-XXX passent par format_numero
+        not_null = series.notna()
+        numeros = series.astype(str).str.strip()
+        needs_fix = not_null & ~numeros.str.match(_NUMERO_PATTERN)
+        
+        # Remplir directement le tableau de sortie (numeros est déjà une nouvelle allocation)
+        cleaned = numeros.to_numpy(dtype=object)
+        cleaned[~not_null.to_numpy()] = None
+        if needs_fix.any():
+            cleaned[needs_fix.to_numpy()] = _dedup_apply(series[needs_fix], format_numero, alerts).to_numpy(dtype=object)
+        
+        return pd.Series(cleaned, index=series.index, name=series.name), alerts
     
     def _clean_name_column(self, series: pd.Series) -> pd.Series:
         """Nettoie les noms (majuscules, espaces)"""
-        def clean_name(name):
-            if pd.isna(name):
-                return None
-            
-            name_str = str(name).strip()
-            # Supprimer les espaces multiples et mettre en forme
-            name_str = re.sub(r'\s+', ' ', name_str)
-            # Mettre en majuscules pour les noms, title case pour les prénoms
-            return name_str.upper() if series.name == 'NOM' else name_str.title()
-        
-        return series.apply(clean_name)
+        # Opérations vectorisées de l'accesseur .str (les valeurs manquantes restent NaN)
+        names = series.dropna().astype(str).str.strip().str.replace(_WHITESPACE_RE, ' ', regex=True)
+        # Mettre en majuscules pour les noms, title case pour les prénoms
+        names = names.str.upper() if series.name == 'NOM' else names.str.title()
+        return names.reindex(series.index)
     
-    def _clean_contact_column(self, series: pd.Series, column_type: str) -> pd.Series:
-        """Nettoie les contacts (téléphone, email)"""
-        def clean_contact(contact):
-            if pd.isna(contact):
-                return None
-            
-            contact_str = str(contact).strip()
-            
-            if column_type == 'Téléphone':
-                # Nettoyer le téléphone : garder uniquement les chiffres et espaces/points/tirets
-                contact_str = re.sub(r'[^\d\s\.\-]', '', contact_str)
-                contact_str = re.sub(r'\s+', ' ', contact_str)
-                return contact_str
-            
-            elif column_type == 'Email':
-                # Validation basique de l'email
-                if '@' in contact_str and '.' in contact_str:
-                    return contact_str.lower()
-                return None
-            
-            return contact_str
-        
-        return series.apply(clean_contact)
+    def _clean_phone_column(self, series: pd.Series) -> pd.Series:
+        """Nettoie les téléphones : garder uniquement les chiffres et espaces/points/tirets"""
+        phones = (series.dropna().astype(str).str.strip()
+                        .str.replace(_PHONE_INVALID_CHARS_RE, '', regex=True)
+                        .str.replace(_WHITESPACE_RE, ' ', regex=True))
+        return phones.reindex(series.index)
+    
+    def _clean_email_column(self, series: pd.Series) -> pd.Series:
+        """Nettoie les emails (validation basique, minuscules)"""
+        emails = series.dropna().astype(str).str.strip()
+        is_valid = emails.str.contains('@', regex=False) & emails.str.contains('.', regex=False)
+        return emails.str.lower().where(is_valid).reindex(series.index)
     
     def _validate_age(self, date_birth_series: pd.Series, age_series: pd.Series) -> Tuple[pd.Series, List[str]]:
-        """Valide et corrige les âges par rapport aux dates de naissance"""
+        """
+        Valide et corrige les âges par rapport aux dates de naissance
+        
+        Seules les lignes avec une date de naissance texte au format DD/MM/YYYY et un âge vide
+        ou entier ("34", "34 ans") sont recalculées ; les autres (âge "trente" ou 34.0,
+        date typée) sont laissées telles quelles, sans alerte.
+        """
         alerts = []
-        cleaned_age = age_series.copy()
         
-        current_year = datetime.now().year
+        # Parser toute la colonne en une fois (valeurs non textuelles et dates invalides -> NaT)
+        is_text = date_birth_series.map(lambda value: isinstance(value, str), na_action='ignore').fillna(False).astype(bool)
+        births = pd.to_datetime(date_birth_series.where(is_text), format='%d/%m/%Y', errors='coerce')
         
-        for idx in date_birth_series.index:
-            birth_date_str = date_birth_series[idx]
-            current_age = age_series[idx] if idx in age_series.index else None
-            
-            if not pd.isna(birth_date_str):
-                try:
-                    # Parser la date de naissance
-                    birth_date = datetime.strptime(str(birth_date_str), '%d/%m/%Y')
-                    calculated_age = current_year - birth_date.year
-                    
-                    # Ajuster si l'anniversaire n'est pas encore passé cette année
-                    if datetime.now().month < birth_date.month or \
-                       (datetime.now().month == birth_date.month and datetime.now().day < birth_date.day):
-                        calculated_age -= 1
-                    
-                    # Vérifier la cohérence avec l'âge indiqué
-                    if not pd.isna(current_age):
-                        current_age_num = int(str(current_age).replace(' ans', '').strip())
-                        if abs(calculated_age - current_age_num) > 1:
-                            alerts.append(f"Âge incohérent corrigé: {current_age} -> {calculated_age} ans")
-                    
-                    cleaned_age[idx] = f"{calculated_age} ans"
-                    
-                except ValueError:
-                    pass
+        # Âge déclaré : vide, ou entier éventuellement suivi de " ans"
+        age_text = age_series.astype(str).str.replace(' ans', '', regex=False).str.strip()
+        declared_ages = pd.to_numeric(age_text.where(age_text.str.fullmatch(_AGE_INTEGER_RE)), errors='coerce').astype('Int64')
+        age_usable = age_series.isna() | declared_ages.notna()
+        
+        valid = births.notna() & age_usable
+        if not valid.any():
+            return age_series, alerts
+        
+        today = pd.Timestamp.today()
+        births = births[valid]
+        
+        # Ajuster si l'anniversaire n'est pas encore passé cette année
+        birthday_pending = (births.dt.month > today.month) | \
+                           ((births.dt.month == today.month) & (births.dt.day > today.day))
+        calculated_ages = today.year - births.dt.year - birthday_pending.astype(int)
+        
+        # Vérifier la cohérence avec l'âge indiqué
+        current_ages = age_series[valid]
+        incoherent = ((calculated_ages - declared_ages[valid]).abs() > 1).fillna(False).astype(bool)
+        alerts.extend(
+            f"Âge incohérent corrigé: {current_age} -> {calculated_age} ans"
+            for current_age, calculated_age in zip(current_ages[incoherent], calculated_ages[incoherent])
+        )
+        
+        cleaned_age = age_series.astype(object)
+        cleaned_age[valid] = calculated_ages.astype(str) + ' ans'
         
         return cleaned_age, alerts
     
@@ -387,21 +517,16 @@ class DataCleaningService:
         if not all(col in df.columns for col in ['Activités Apprenants Début', 'Activités Apprenants Fin', 'Durée Activité Apprenants']):
             return alerts
         
-        for idx in df.index:
-            debut = df.loc[idx, 'Activités Apprenants Début']
-            fin = df.loc[idx, 'Activités Apprenants Fin']
-            duree = df.loc[idx, 'Durée Activité Apprenants']
-            
-            if not pd.isna(debut) and not pd.isna(fin):
-                try:
-                    debut_time = datetime.strptime(str(debut), '%H:%M').time()
-                    fin_time = datetime.strptime(str(fin), '%H:%M').time()
-                    
-                    if fin_time <= debut_time:
-                        alerts.append(f"Ligne {idx}: Heure de fin antérieure au début ({debut} -> {fin})")
-                        
-                except ValueError:
-                    continue
+        # Comparaison entière en minutes depuis minuit (les valeurs invalides deviennent NaN)
+        debut = _hhmm_to_minutes(df['Activités Apprenants Début'])
+        fin = _hhmm_to_minutes(df['Activités Apprenants Fin'])
+        incoherent = np.less_equal(fin, debut)  # Toute comparaison avec NaN est fausse
+        
+        rows = df.loc[incoherent, ['Activités Apprenants Début', 'Activités Apprenants Fin']]
+        alerts.extend(
+            f"Ligne {idx}: Heure de fin antérieure au début ({debut_val} -> {fin_val})"
+            for idx, debut_val, fin_val in rows.itertuples(name=None)
+        )
         
         return alerts
     
@@ -417,6 +542,14 @@ class DataCleaningService:
             'status': 'success' if len(inscription_alerts) + len(presence_alerts) == 0 else 'cleaned'
         }
     
+    def _get_numero_set(self, df: pd.DataFrame, column: str) -> frozenset:
+        """Ensemble des numéros d'une colonne, reconstruit seulement quand le DataFrame change"""
+        cached = self._numero_sets.get(column)
+        if cached is None or cached[0] is not df:
+            cached = (df, frozenset(df[column].dropna()))
+            self._numero_sets[column] = cached
+        return cached[1]
+    
     def validate_apprenant_exists(self, numero_apprenant: str, inscription_df: pd.DataFrame, presence_df: pd.DataFrame) -> Dict:
         """Valide qu'un apprenant existe et a des données cohérentes"""
         result = {
@@ -429,11 +562,11 @@ class DataCleaningService:
         
         # Vérifier existence dans inscriptions
         if not inscription_df.empty and 'N°' in inscription_df.columns:
-            result['exists_inscription'] = numero_apprenant in inscription_df['N°'].values
+            result['exists_inscription'] = numero_apprenant in self._get_numero_set(inscription_df, 'N°')
         
         # Vérifier existence dans présences
         if not presence_df.empty and 'Numéro Apprenant' in presence_df.columns:
-            result['exists_presence'] = numero_apprenant in presence_df['Numéro Apprenant'].values
+            result['exists_presence'] = numero_apprenant in self._get_numero_set(presence_df, 'Numéro Apprenant')
         
         # Déterminer le statut et message
         if result['exists_inscription'] and result['exists_presence']:
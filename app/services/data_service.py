@@ -4,19 +4,72 @@
 # et les fonctionnalités de planification/reporting
 
 import pandas as pd              # Bibliothèque pour manipuler les données (DataFrames)
+import numpy as np               # Calculs vectorisés sur les séries de présence
 from pathlib import Path         # Pour gérer les chemins de fichiers de manière moderne
 import openpyxl                  # Pour manipuler les fichiers Excel directement
 import os                        # Pour les opérations système
 from datetime import datetime, timedelta    # Pour gérer les dates et heures
 import json                      # Pour manipuler les fichiers JSON
+import functools                 # Pour la mémoïsation (lru_cache)
+import inspect                   # Pour localiser le source du service de nettoyage (clé du cache)
 import re                        # Pour les expressions régulières
+import hashlib                   # Pour l'empreinte des fichiers Excel (cache des données nettoyées)
 import logging                   # Pour les logs
 from .data_cleaning_service import DataCleaningService  # Service de nettoyage des données
 from .file_lock_service import file_lock_service  # Service de verrouillage de fichiers
+from app.models.data_loader import EXCEL_ENGINE  # Lecteur XLSX (calamine si disponible, sinon openpyxl)
+
+# Import optionnel de pyarrow (chaînes Arrow : recherches str.contains dans le noyau C++ d'Arrow)
+try:
+    import pyarrow  # noqa: F401
+    SEARCH_STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    SEARCH_STRING_DTYPE = None
+
+# Import optionnel d'orjson (lecture/écriture JSON en Rust, plus rapide que json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configuration du logger pour ce module
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=1)
+def _cleaning_signature():
+    """
+    Empreinte des règles de nettoyage (octets), incluse dans la clé du cache des données nettoyées
+    
+    Combine DataCleaningService.CLEANING_VERSION et, s'il est lisible (hors exécutable empaqueté),
+    le source du module de nettoyage : toute modification du service invalide le cache.
+    """
+    signature = f"v{DataCleaningService.CLEANING_VERSION}".encode()
+    try:
+        signature += Path(inspect.getfile(DataCleaningService)).read_bytes()
+    except (OSError, TypeError):
+        pass
+    return signature
+
+
+def _read_json_file(path):
+    """Lit un fichier JSON (orjson si disponible)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json_file(path, data):
+    """Écrit un fichier JSON UTF-8 indenté sur 2 espaces (orjson si disponible)"""
+    if ORJSON_AVAILABLE:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
 class DataService:
     """
     Service principal pour la gestion des données de l'application
@@ -33,6 +86,38 @@ class DataService:
     - DAO : Accès aux données (fichiers Excel, JSON)
     """
     
+    # En-têtes du fichier inscription.xlsx (ordre des colonnes Excel)
+    INSCRIPTION_COLUMNS = [
+        "N°", "NOM", "Prénom", "Sexe", "Date de naissance", "Age", 
+        "Pays de naissance", "Nationalité", "Continent", "ISO", 
+        "Arrivée en France", "Document", "Statut à l'entrée", "Statut actuel",
+        "Adresse", "Code postal", "Ville", "Prioritaire/Veille", 
+        "Type de logement", "Téléphone", "Email", "Situation Familiale",
+        "Revenus", "Langues Parlées", "Prescripteur", "Structure actuelle",
+        "Date inscription", "Première venue", "Commentaires"
+    ]
+    
+    # Colonnes d'inscription à faible cardinalité, stockées en 'category'
+    # (égalités, unique et tris travaillent sur les codes entiers)
+    CATEGORY_COLUMNS = ['Sexe', 'Ville', 'Prioritaire/Veille', 'Continent', 'Nationalité', 'Type de logement']
+    
+    # Colonnes attendues dans la grille d'évaluations (alternatives si noms différents)
+    EVAL_COLUMN_CANDIDATES = {
+        'numero': ['Numero_apprenant', 'Numero'],
+        'date': ['Date', 'date', 'DATE'],
+        'note': ['Note_test_sur_20', 'Note', 'Note_sur_20'],
+        'compr_oral': ['Comprehension_orale'],
+        'compr_ecrit': ['Comprehension_ecrit', 'Comprehension_écrit'],
+        'prod_oral': ['Production_orale'],
+        'prod_ecrit': ['Production_ecrit'],
+        'observation': ['Observation', 'Observations'],
+        'niveau': ['Niveau_global', 'Niveau']
+    }
+    
+    # Formats de durée reconnus par _convertir_duree_en_minutes, compilés une seule fois
+    _DUREE_HEURES_RE = re.compile(r'^(\d+)\s*h(?:\s*(\d+))?')
+    _DUREE_MINUTES_RE = re.compile(r'^(\d+)\s*min')
+    
     def __init__(self, data_folder='data'):
         """
         Initialise le service de données
@@ -62,6 +147,15 @@ class DataService:
         self.last_cleaning_alerts = {'inscription': [], 'presence': []}
         self.data_quality_score = 0
         
+        # Cache de la grille d'évaluations (rechargée seulement si le fichier est modifié)
+        self._eval_cache = None
+        self._eval_mtime = None
+        self._eval_col_map = {}
+        self._eval_by_numero = {}
+        
+        # Cache des fichiers JSON de configuration : chemin -> (mtime, contenu)
+        self._json_cache = {}
+        
         # Charger les données au démarrage
         self.load_data()
     
@@ -76,24 +170,31 @@ class DataService:
         try:
             # Utiliser le DataLoader pour obtenir les DataFrames
             # Le DataLoader gère automatiquement le cache et la vérification de modification de fichiers
-            raw_inscription_df = self.data_loader.inscriptions.copy()
-            raw_presence_df = self.data_loader.presences.copy()
-            
-            # Appliquer le nettoyage automatique
+            # Les données déjà nettoyées pour un même fichier Excel sont relues depuis le cache disque
             logger.debug("Nettoyage automatique des données en cours...")
             
             # Nettoyer les données d'inscription
-            self.inscription_df, inscription_alerts = self.cleaning_service.clean_inscription_data(raw_inscription_df)
+            self.inscription_df, inscription_alerts = self._load_cleaned_data(
+                'inscription', self.data_loader.config.INSCRIPTION_FILE,
+                lambda: self.data_loader.inscriptions, self.cleaning_service.clean_inscription_data
+            )
             self.last_cleaning_alerts['inscription'] = inscription_alerts
+            self._categorize_inscription_columns()
             
             # Nettoyer les données de présence
-            self.presence_df, presence_alerts = self.cleaning_service.clean_presence_data(raw_presence_df)
+            self.presence_df, presence_alerts = self._load_cleaned_data(
+                'presence', self.data_loader.config.PRESENCE_FILE,
+                lambda: self.data_loader.presences, self.cleaning_service.clean_presence_data
+            )
             self.last_cleaning_alerts['presence'] = presence_alerts
+            self._sort_presences_by_date()
+            
+            # Colonnes dérivées calculées une fois par chargement (gardées hors du DataFrame exposé)
+            self._refresh_derived_data()
             
             # Calculer le score de qualité des données
             total_alerts = len(inscription_alerts) + len(presence_alerts)
-            total_records = len(self.inscription_df) + len(self.presence_df)
-            self.data_quality_score = max(0, 100 - (total_alerts / max(total_records, 1) * 100))
+            self._update_quality_score()
             
             # Log du résumé de nettoyage (seulement en mode debug)
             logger.debug(f"Nettoyage terminé - Score qualité: {self.data_quality_score:.1f}%")
@@ -107,9 +208,197 @@ class DataService:
             # Créer des DataFrames vides pour éviter les erreurs
             self.inscription_df = pd.DataFrame()
             self.presence_df = pd.DataFrame()
+            self._inscription_dates = pd.Series(dtype='datetime64[ns]')
+            self._inscription_months = self._inscription_dates.dt.to_period('M')
+            self._inscription_by_numero = {}
+            self._presence_positions = {}
+            self._presence_dates = self._inscription_dates.to_numpy()
+            self._presence_valid_dates = 0
+            self._search_lower = {}
             self.last_cleaning_alerts = {'inscription': [f'Erreur: {str(e)}'], 'presence': []}
             self.data_quality_score = 0
     
+    def _load_cleaned_data(self, kind, source_path, load_raw, clean):
+        """
+        Retourne (DataFrame nettoyé, alertes) en réutilisant le cache disque si le fichier source est inchangé
+        
+        Le cache est indexé par l'empreinte (blake2b) du contenu du fichier Excel :
+        data/.cache/<kind>_<empreinte>.pkl pour le DataFrame et <kind>_<empreinte>_alerts.json pour les alertes.
+        Le pickle conserve exactement les types des colonnes objet (dates texte, heures, None).
+        
+        Args:
+            kind (str): 'inscription' ou 'presence'
+            source_path (Path): Fichier Excel source
+            load_raw (callable): Retourne le DataFrame brut (lu seulement en cas d'absence de cache)
+            clean (callable): Fonction de nettoyage retournant (DataFrame, alertes)
+        """
+        df_path = alerts_path = None
+        
+        try:
+            df_path, alerts_path = self._cleaned_cache_paths(kind, source_path)
+            if df_path is not None and df_path.exists() and alerts_path.exists():
+                return pd.read_pickle(df_path), json.loads(alerts_path.read_text(encoding='utf-8'))
+        except Exception as e:
+            logger.warning(f"Cache des données nettoyées ({kind}) illisible, nouveau nettoyage: {e}")
+        
+        df_clean, alerts = clean(load_raw().copy())
+        # Le nettoyage remplace les colonnes une à une (un bloc mémoire par colonne) :
+        # une copie profonde regroupe les colonnes en un bloc contigu par type,
+        # avant les opérations vectorisées et l'écriture du cache
+        df_clean = df_clean.copy()
+        self._write_cleaned_cache(kind, df_path, alerts_path, df_clean, alerts)
+        
+        return df_clean, alerts
+    
+    def _cleaned_cache_paths(self, kind, source_path):
+        """
+        Chemins (DataFrame, alertes) du cache disque pour le contenu actuel du fichier source
+        et la version courante du nettoyage, (None, None) s'il n'existe pas
+        """
+        if not Path(source_path).exists():
+            return None, None
+        cache_dir = Path(self.data_folder) / '.cache'
+        hasher = hashlib.blake2b(Path(source_path).read_bytes(), digest_size=16)
+        # Les règles de nettoyage font partie de la clé : un changement du service invalide le cache
+        hasher.update(_cleaning_signature())
+        digest = hasher.hexdigest()
+        return cache_dir / f'{kind}_{digest}.pkl', cache_dir / f'{kind}_{digest}_alerts.json'
+    
+    def _write_cleaned_cache(self, kind, df_path, alerts_path, df_clean, alerts):
+        """Écrit le cache disque d'un type de données en supprimant les versions obsolètes"""
+        if df_path is None:
+            return
+        try:
+            df_path.parent.mkdir(parents=True, exist_ok=True)
+            # Supprimer les caches obsolètes de ce type avant d'écrire le nouveau
+            for old_file in df_path.parent.glob(f'{kind}_*'):
+                old_file.unlink(missing_ok=True)
+            df_clean.to_pickle(df_path)
+            alerts_path.write_text(json.dumps(alerts, ensure_ascii=False), encoding='utf-8')
+        except Exception as e:
+            logger.warning(f"Impossible d'écrire le cache des données nettoyées ({kind}): {e}")
+    
+    def _append_inscription_rows(self, rows, file_path):
+        """
+        Ajoute des inscriptions déjà écrites dans le fichier Excel aux données en mémoire
+        
+        Seules les nouvelles lignes passent par le nettoyage ; le fichier des présences
+        n'est pas relu. Le cache disque est mis à jour pour le nouveau contenu du fichier.
+        
+        Args:
+            rows (list[list]): Lignes dans l'ordre de INSCRIPTION_COLUMNS
+            file_path (Path): Fichier inscription.xlsx qui vient d'être sauvegardé
+        """
+        new_df = pd.DataFrame(rows, columns=self.INSCRIPTION_COLUMNS)
+        # Les champs vides sont relus comme valeurs manquantes depuis Excel
+        new_df = new_df.mask(new_df == '')
+        new_df = self._match_numeric_dtypes(new_df, self.inscription_df)
+        cleaned_rows, alerts = self.cleaning_service.clean_inscription_data(new_df)
+        
+        self.inscription_df = pd.concat([self.inscription_df, cleaned_rows], ignore_index=True)
+        # La concaténation avec des lignes 'object' repasse les colonnes catégorielles en 'object'
+        self._categorize_inscription_columns()
+        self.last_cleaning_alerts['inscription'] = self.last_cleaning_alerts['inscription'] + alerts
+        self._refresh_derived_data()
+        self._update_quality_score()
+        
+        df_path, alerts_path = self._cleaned_cache_paths('inscription', file_path)
+        self._write_cleaned_cache('inscription', df_path, alerts_path,
+                                  self.inscription_df, self.last_cleaning_alerts['inscription'])
+    
+    @staticmethod
+    def _match_numeric_dtypes(new_df, reference_df):
+        """
+        Aligne les colonnes numériques des nouvelles lignes sur celles du DataFrame déjà chargé
+        
+        Une relecture complète du fichier Excel donne par exemple un 'Code postal' numérique (75001.0) :
+        les valeurs saisies ('75001') sont converties de la même façon, pour que les données en mémoire
+        et le cache disque ne dépendent pas de la manière dont le DataFrame a été construit.
+        
+        Raises:
+            ValueError: si une valeur n'est pas numérique (seule une relecture complète donne alors le bon type)
+        """
+        for col in new_df.columns.intersection(reference_df.columns):
+            dtype = reference_df[col].dtype
+            if not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+                continue
+            values = pd.to_numeric(new_df[col], errors='coerce')
+            if (values.isna() & new_df[col].notna()).any():
+                raise ValueError(f"valeur non numérique dans la colonne '{col}'")
+            if pd.api.types.is_float_dtype(dtype):
+                values = values.astype(dtype)
+            new_df[col] = values
+        return new_df
+    
+    def _categorize_inscription_columns(self):
+        """Convertit les colonnes à faible cardinalité (CATEGORY_COLUMNS) en type 'category'"""
+        for col in self.CATEGORY_COLUMNS:
+            if col in self.inscription_df.columns and self.inscription_df[col].dtype != 'category':
+                self.inscription_df[col] = self.inscription_df[col].astype('category')
+    
+    def _refresh_derived_data(self):
+        """Recalcule les données dérivées (noms complets, index de recherche) après un changement des DataFrames"""
+        self._build_inscription_dates()
+        self._build_lookup_indexes()
+        self._build_search_columns()
+    
+    def _update_quality_score(self):
+        """Calcule le score de qualité des données à partir des alertes de nettoyage"""
+        total_alerts = len(self.last_cleaning_alerts['inscription']) + len(self.last_cleaning_alerts['presence'])
+        total_records = len(self.inscription_df) + len(self.presence_df)
+        self.data_quality_score = max(0, 100 - (total_alerts / max(total_records, 1) * 100))
+    
+    def _build_inscription_dates(self):
+        """Convertit une fois les dates d'inscription (texte DD/MM/YYYY après nettoyage) et leurs mois"""
+        if 'Date inscription' in self.inscription_df.columns:
+            self._inscription_dates = pd.to_datetime(
+                self.inscription_df['Date inscription'], format='%d/%m/%Y', errors='coerce'
+            )
+        else:
+            self._inscription_dates = pd.Series(pd.NaT, index=self.inscription_df.index, dtype='datetime64[ns]')
+        self._inscription_months = self._inscription_dates.dt.to_period('M')
+    
+    def _build_lookup_indexes(self):
+        """
+        Construit les index de recherche par numéro d'apprenant (une fois par chargement)
+        
+        - _inscription_by_numero : numéro -> enregistrement d'inscription (première occurrence)
+        - _presence_positions : numéro -> positions (iloc) des lignes de présence
+        """
+        self._inscription_by_numero = {}
+        if not self.inscription_df.empty and 'N°' in self.inscription_df.columns:
+            first_rows = self.inscription_df.drop_duplicates(subset='N°', keep='first')
+            self._inscription_by_numero = dict(zip(first_rows['N°'], first_rows.to_dict('records')))
+        
+        self._presence_positions = {}
+        if not self.presence_df.empty and 'Numéro Apprenant' in self.presence_df.columns:
+            self._presence_positions = self.presence_df.groupby('Numéro Apprenant', sort=False).indices
+    
+    def _build_search_columns(self):
+        """
+        Colonnes de recherche mises en minuscules une fois par chargement (recherches textuelles sans regex)
+        
+        Avec pyarrow, elles sont stockées en 'string[pyarrow]' (tampons contigus, str.contains en C++).
+        Les DataFrames exposés gardent leurs colonnes objet : pas de pd.NA dans les enregistrements JSON.
+        """
+        self._search_lower = {}
+        for kind, df, columns in (('inscription', self.inscription_df, ('NOM', 'Prénom')),
+                                  ('presence', self.presence_df, ('Apprenant',))):
+            for col in columns:
+                if col in df.columns:
+                    # Les valeurs non textuelles deviennent NaN et ne correspondent à aucune recherche
+                    lowered = df[col].astype(object).str.lower()
+                    if SEARCH_STRING_DTYPE:
+                        lowered = lowered.astype(SEARCH_STRING_DTYPE)
+                    self._search_lower[(kind, col)] = lowered
+    
+    def _contains_text(self, kind, column, text):
+        """
+        Masque des lignes dont la colonne contient le texte recherché
+        (sous-chaîne littérale, insensible à la casse : les caractères spéciaux ne sont pas interprétés)
+        """
+        return self._search_lower[(kind, column)].str.contains(text.lower(), regex=False, na=False)
+    
     def get_total_inscrits(self):
         """
         Retourne le nombre total d'apprenants inscrits
@@ -138,141 +427,167 @@ class DataService:
         if self.presence_df.empty or self.inscription_df.empty:
             return None
 
-        # Copier les DataFrames pour éviter de modifier les originaux
-        presence_df = self.presence_df.copy()
-        inscription_df = self.inscription_df.copy()
-
-        # Créer une colonne nom complet dans les inscriptions
-        # pour faciliter la correspondance avec les présences
-        inscription_df['FullName'] = inscription_df['Prénom'].fillna('') + ' ' + inscription_df['NOM'].fillna('')
+        # Lecture seule : pas de copie des DataFrames, les filtres produisent de nouveaux objets
+        presence_df = self.presence_df
 
         # Vérifier que le nom de la personne est fourni
         if not person_name:
             return None
 
-        # Échapper les caractères spéciaux pour éviter les erreurs regex
-        safe_person_name = re.escape(person_name)
-
         # Filtrer les présences où le nom de l'apprenant contient le nom recherché
-        filtered_presence = presence_df[presence_df['Apprenant'].str.contains(safe_person_name, case=False, na=False)]
+        filtered_presence = presence_df[self._contains_text('presence', 'Apprenant', person_name)]
 
         if filtered_presence.empty:
             return None
 
-        # Fusionner les présences filtrées avec les inscriptions
-        merged_df = filtered_presence.merge(inscription_df, left_on='Apprenant', right_on='FullName', how='left')
-
-        if merged_df.empty:
-            return None
-
-        # Extraire le jour de la semaine depuis la colonne 'Date du Jour'
-        merged_df.loc[:, 'Jour de la semaine'] = pd.to_datetime(merged_df['Date du Jour']).dt.day_name()
+        # Extraire le jour de la semaine depuis la colonne 'Date du Jour' (format DD/MM/YYYY après nettoyage)
+        # Pas de jointure avec les inscriptions : seules les dates de présence sont nécessaires
+        jours = pd.to_datetime(filtered_presence['Date du Jour'], format='%d/%m/%Y', errors='coerce').dt.day_name()
 
         # Obtenir les jours uniques de présence
-        days_present = merged_df['Jour de la semaine'].unique().tolist()
+        days_present = jours.dropna().unique().tolist()
 
         return days_present
 
     def add_inscription(self, data):
+        """Ajoute une inscription (voir add_inscriptions pour l'ajout groupé)"""
+        success, message, numeros = self.add_inscriptions([data])
+        if not success:
+            return False, message
+        return True, f"Inscription ajoutée avec succès ! Numéro d'inscription: {numeros[0]}"
+    
+    def add_inscriptions(self, entries):
+        """
+        Ajoute plusieurs inscriptions en un seul cycle ouverture/sauvegarde du classeur
+        
+        Pour un import ou une saisie en série, le fichier Excel n'est chargé, écrit
+        et relu qu'une seule fois quel que soit le nombre d'inscriptions.
+        
+        Args:
+            entries (list[dict]): Données des formulaires d'inscription
+            
+        Returns:
+            tuple: (succès, message, liste des numéros attribués)
+        """
+        if not entries:
+            return True, "Aucune inscription à ajouter", []
+        
         try:
             file_path = self.data_folder / 'inscription.xlsx'
             
-            # Calculer l'âge si la date de naissance est fournie
-            age = ""
-            if data.get('date_naissance'):
-                birth_date = datetime.strptime(data['date_naissance'], '%Y-%m-%d')
-                today = datetime.now()
-                age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
-                age = f"{age} ans"
-            
-            # Générer un numéro d'inscription automatique
+            # Générer les numéros d'inscription automatiques
             current_year = datetime.now().year % 100  # Derniers 2 chiffres de l'année
-            numero = f"{current_year:02d}-"
+            prefix = f"{current_year:02d}-"
             
             if file_path.exists():
+                # Trouver le prochain numéro disponible à partir de la colonne N° déjà chargée
+                # (le DataLoader relit le fichier s'il a été modifié depuis le dernier chargement)
+                next_number = self._next_numero_suffix(self.data_loader.inscriptions, prefix)
+                
+                # Le classeur n'est ouvert que pour ajouter les lignes
                 wb = openpyxl.load_workbook(file_path)
                 ws = wb.active
-                
-                # Trouver le prochain numéro disponible
-                existing_numbers = []
-                for row in ws.iter_rows(min_row=2, max_col=1, values_only=True):
-                    if row[0] and isinstance(row[0], str) and row[0].startswith(f"{current_year:02d}-"):
-                        try:
-                            num = int(row[0].split('-')[1])
-                            existing_numbers.append(num)
-                        except (ValueError, IndexError):
-                            continue
-                
-                next_number = max(existing_numbers, default=0) + 1
-                numero += f"{next_number:03d}"
             else:
-                wb = openpyxl.Workbook()
-                ws = wb.active
+                # Nouveau fichier : mode write_only (écriture en flux, sans modèle de cellules en mémoire)
+                wb = openpyxl.Workbook(write_only=True)
+                ws = wb.create_sheet()
                 # Créer les en-têtes selon la structure Excel
-                headers = [
-                    "N°", "NOM", "Prénom", "Sexe", "Date de naissance", "Age", 
-                    "Pays de naissance", "Nationalité", "Continent", "ISO", 
-                    "Arrivée en France", "Document", "Statut à l'entrée", "Statut actuel",
-                    "Adresse", "Code postal", "Ville", "Prioritaire/Veille", 
-                    "Type de logement", "Téléphone", "Email", "Situation Familiale",
-                    "Revenus", "Langues Parlées", "Prescripteur", "Structure actuelle",
-                    "Date inscription", "Première venue", "Commentaires"
-                ]
-                ws.append(headers)
-                numero += "001"
-            
-            # Préparer les données dans l'ordre des colonnes Excel
-            row_data = [
-                numero,                              # N°
-                data.get('nom', ''),                # NOM
-                data.get('prenom', ''),             # Prénom
-                data.get('sexe', ''),               # Sexe
-                data.get('date_naissance', ''),     # Date de naissance
-                age,                                # Age
-                data.get('pays_naissance', ''),     # Pays de naissance
-                data.get('nationalite', ''),        # Nationalité
-                data.get('continent', ''),          # Continent
-                '',                                 # ISO (vide par défaut)
-                data.get('arrivee_france', ''),     # Arrivée en France
-                data.get('document', ''),           # Document
-                data.get('statut_entree', ''),      # Statut à l'entrée
-                data.get('statut_actuel', ''),      # Statut actuel
-                data.get('adresse', ''),            # Adresse
-                data.get('code_postal', ''),        # Code postal
-                data.get('ville', ''),              # Ville
-                data.get('prioritaire_veille', ''), # Prioritaire/Veille
-                data.get('type_logement', ''),      # Type de logement
-                data.get('telephone', ''),          # Téléphone
-                data.get('email', ''),              # Email
-                data.get('situation_familiale', ''), # Situation Familiale
-                data.get('revenus', ''),            # Revenus
-                data.get('langues_parlees', ''),    # Langues Parlées
-                data.get('prescripteur', ''),       # Prescripteur
-                data.get('structure_actuelle', ''), # Structure actuelle
-                data.get('date_inscription', ''),   # Date inscription
-                data.get('premiere_venue', ''),     # Première venue
-                data.get('commentaires', '')        # Commentaires
-            ]
+                ws.append(self.INSCRIPTION_COLUMNS)
+                next_number = 1
+            
+            numeros = []
+            rows = []
+            for offset, data in enumerate(entries):
+                numero = f"{prefix}{next_number + offset:03d}"
+                row_data = self._build_inscription_row(data, numero)
+                ws.append(row_data)
+                rows.append(row_data)
+                numeros.append(numero)
             
-            ws.append(row_data)
             wb.save(file_path)
-            self.load_data()  # Reload data after update
-            return True, f"Inscription ajoutée avec succès ! Numéro d'inscription: {numero}"
+            
+            # Mise à jour incrémentale : seules les nouvelles lignes sont nettoyées
+            try:
+                self._append_inscription_rows(rows, file_path)
+            except Exception as e:
+                logger.warning(f"Mise à jour incrémentale impossible, rechargement complet: {e}")
+                self.load_data()
+            return True, f"{len(numeros)} inscription(s) ajoutée(s)", numeros
         except Exception as e:
-            return False, f"Erreur lors de l'ajout : {str(e)}"
-
+            return False, f"Erreur lors de l'ajout : {str(e)}", []
+    
+    @staticmethod
+    def _build_inscription_row(data, numero):
+        """Prépare une ligne d'inscription dans l'ordre des colonnes Excel"""
+        # Calculer l'âge si la date de naissance est fournie
+        age = ""
+        if data.get('date_naissance'):
+            birth_date = datetime.strptime(data['date_naissance'], '%Y-%m-%d')
+            today = datetime.now()
+            age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
+            age = f"{age} ans"
+        
+        # Préparer les données dans l'ordre des colonnes Excel
+        row_data = [
+            numero,                              # N°
+            data.get('nom', ''),                # NOM
+            data.get('prenom', ''),             # Prénom
+            data.get('sexe', ''),               # Sexe
+            data.get('date_naissance', ''),     # Date de naissance
+            age,                                # Age
+            data.get('pays_naissance', ''),     # Pays de naissance
+            data.get('nationalite', ''),        # Nationalité
+            data.get('continent', ''),          # Continent
+            '',                                 # ISO (vide par défaut)
+            data.get('arrivee_france', ''),     # Arrivée en France
+            data.get('document', ''),           # Document
+            data.get('statut_entree', ''),      # Statut à l'entrée
+            data.get('statut_actuel', ''),      # Statut actuel
+            data.get('adresse', ''),            # Adresse
+            data.get('code_postal', ''),        # Code postal
+            data.get('ville', ''),              # Ville
+            data.get('prioritaire_veille', ''), # Prioritaire/Veille
+            data.get('type_logement', ''),      # Type de logement
+            data.get('telephone', ''),          # Téléphone
+            data.get('email', ''),              # Email
+            data.get('situation_familiale', ''), # Situation Familiale
+            data.get('revenus', ''),            # Revenus
+            data.get('langues_parlees', ''),    # Langues Parlées
+            data.get('prescripteur', ''),       # Prescripteur
+            data.get('structure_actuelle', ''), # Structure actuelle
+            data.get('date_inscription', ''),   # Date inscription
+            data.get('premiere_venue', ''),     # Première venue
+            data.get('commentaires', '')        # Commentaires
+        ]
+        return row_data
 
+    @staticmethod
+    def _next_numero_suffix(inscription_df, prefix):
+        """
+        Retourne le prochain numéro séquentiel pour un préfixe d'année (ex: '25-')
+        
+        Seuls les numéros texte commençant par le préfixe sont pris en compte ; la partie
+        après le tiret est convertie en entier (les valeurs non numériques sont ignorées).
+        """
+        if inscription_df.empty or 'N°' not in inscription_df.columns:
+            return 1
+        
+        numeros = inscription_df['N°'].astype(object)
+        is_current_year = numeros.str.startswith(prefix, na=False)
+        suffixes = pd.to_numeric(numeros[is_current_year].str.split('-').str[1], errors='coerce')
+        return int(suffixes.max()) + 1 if suffixes.notna().any() else 1
+    
     def get_person_info_by_name(self, person_name):
         """Get formatted information about a person by their name."""
         if self.inscription_df.empty:
             return None
 
-        inscription_df = self.inscription_df.copy()
+        inscription_df = self.inscription_df
 
         # Filter rows where NOM or Prénom contains person_name (case insensitive)
         filtered = inscription_df[
-            (inscription_df['NOM'].str.contains(person_name, case=False, na=False)) |
-            (inscription_df['Prénom'].str.contains(person_name, case=False, na=False))
+            self._contains_text('inscription', 'NOM', person_name) |
+            self._contains_text('inscription', 'Prénom', person_name)
         ]
 
         if filtered.empty:
@@ -297,26 +612,29 @@ class DataService:
         if self.inscription_df.empty:
             return []
         
-        df = self.inscription_df.copy()
+        df = self.inscription_df
+        
+        # Un seul masque booléen combiné, puis une seule sélection de lignes
+        mask = pd.Series(True, index=df.index)
         
         # Filtre par recherche (nom ou prénom)
         if search:
-            mask = (df['NOM'].str.contains(search, case=False, na=False) | 
-                   df['Prénom'].str.contains(search, case=False, na=False))
-            df = df[mask]
+            mask &= (self._contains_text('inscription', 'NOM', search) |
+                     self._contains_text('inscription', 'Prénom', search))
         
         # Filtre par sexe
         if sexe:
-            df = df[df['Sexe'] == sexe]
+            mask &= df['Sexe'] == sexe
         
         # Filtre par ville
         if ville:
-            df = df[df['Ville'] == ville]
+            mask &= df['Ville'] == ville
         
         # Filtre par prioritaire
         if prioritaire:
-            df = df[df['Prioritaire/Veille'] == prioritaire]
+            mask &= df['Prioritaire/Veille'] == prioritaire
         
+        df = df[mask]
         return df.to_dict('records')
     
     def get_inscription_statistics(self):
@@ -324,37 +642,24 @@ class DataService:
         if self.inscription_df.empty:
             return {'total': 0, 'mois': 0, 'semaine': 0, 'prioritaires': 0}
         
-        df = self.inscription_df.copy()
+        df = self.inscription_df
         
         # Total
         total = len(df)
         
+        # Dates d'inscription et mois correspondants, convertis une fois au chargement
+        now = datetime.now()
+        
         # Ce mois-ci
-        current_month = datetime.now().strftime('%m/%Y')
-        mois = 0
-        if 'Date inscription' in df.columns:
-            try:
-                # Convertir les dates et filtrer
-                df['Date inscription'] = pd.to_datetime(df['Date inscription'], errors='coerce')
-                current_month_mask = df['Date inscription'].dt.strftime('%m/%Y') == current_month
-                mois = current_month_mask.sum()
-            except:
-                mois = 0
+        mois = int((self._inscription_months == pd.Period(now, 'M')).sum())
         
         # Cette semaine (approximation)
-        semaine = 0
-        if 'Date inscription' in df.columns:
-            try:
-                week_start = datetime.now() - pd.Timedelta(days=7)
-                recent_mask = df['Date inscription'] >= week_start
-                semaine = recent_mask.sum()
-            except:
-                semaine = 0
+        semaine = int((self._inscription_dates >= now - pd.Timedelta(days=7)).sum())
         
         # Prioritaires
         prioritaires = 0
         if 'Prioritaire/Veille' in df.columns:
-            prioritaires = (df['Prioritaire/Veille'] == 'P').sum()
+            prioritaires = int((df['Prioritaire/Veille'] == 'P').sum())
         
         return {
             'total': total,
@@ -368,18 +673,23 @@ class DataService:
         if self.inscription_df.empty or 'Ville' not in self.inscription_df.columns:
             return []
         
-        return sorted(self.inscription_df['Ville'].dropna().unique().tolist())
+        villes = self.inscription_df['Ville']
+        if villes.dtype == 'category':
+            # Catégories effectivement utilisées (sans NaN), sans parcourir les lignes
+            return sorted(villes.cat.remove_unused_categories().cat.categories.tolist())
+        return sorted(villes.dropna().unique().tolist())
     
     def get_inscription_details(self, numero):
         """Retourner les détails d'une inscription par son numéro"""
         if self.inscription_df.empty:
             return None
         
-        inscription = self.inscription_df[self.inscription_df['N°'] == numero]
-        if inscription.empty:
+        inscription = self._inscription_by_numero.get(numero)
+        if inscription is None:
             return None
         
-        return inscription.iloc[0].to_dict()
+        # Copie du dictionnaire pour que l'appelant ne modifie pas l'index
+        return dict(inscription)
     
     def export_inscriptions(self):
         """Créer un fichier Excel d'export"""
@@ -397,8 +707,8 @@ class DataService:
             shutil.copy2(original_path, export_path)
         else:
             # Créer un nouveau fichier vide si l'original n'existe pas
-            wb = openpyxl.Workbook()
-            ws = wb.active
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet()
             ws.append(["Aucune donnée disponible"])
             wb.save(export_path)
         
@@ -409,40 +719,24 @@ class DataService:
         if self.inscription_df.empty:
             return []
         
-        apprenants = []
-        for _, row in self.inscription_df.iterrows():
-            apprenant_data = {
-                'numero': row['N°'],
-                'nom': row.get('NOM', ''),
-                'prenom': row.get('Prénom', ''),
-                'nom_complet': f"{row.get('NOM', '')} {row.get('Prénom', '')}"  # MODIFIÉ: NOM Prénom
-            }
-            
-            # Ajouter la date d'inscription si disponible pour le tri
-            if 'Date inscription' in self.inscription_df.columns:
-                try:
-                    date_inscription = pd.to_datetime(row.get('Date inscription'), errors='coerce')
-                    apprenant_data['date_inscription'] = date_inscription
-                except:
-                    apprenant_data['date_inscription'] = pd.NaT
-            else:
-                apprenant_data['date_inscription'] = pd.NaT
-            
-            apprenants.append(apprenant_data)
+        df = self.inscription_df
+        
+        # Colonnes de travail construites en une fois (colonnes absentes ou valeurs manquantes -> '')
+        apprenants = df.reindex(columns=['N°', 'NOM', 'Prénom']).fillna('')
+        apprenants.columns = ['numero', 'nom', 'prenom']
+        apprenants['nom_complet'] = apprenants['nom'].astype(str) + ' ' + apprenants['prenom'].astype(str)  # MODIFIÉ: NOM Prénom
+        
+        # Date d'inscription pour le tri (convertie au chargement)
+        apprenants['date_inscription'] = self._inscription_dates
         
         # Trier par date d'inscription (plus récents en premier), puis par nom complet
         # Les apprenants sans date valide seront placés à la fin
-        apprenants.sort(key=lambda x: (
-            x['date_inscription'] is pd.NaT,  # False pour les dates valides (placées en premier)
-            -x['date_inscription'].timestamp() if x['date_inscription'] is not pd.NaT else 0,  # Tri décroissant par timestamp
-            x['nom_complet']  # Tri alphabétique en cas d'égalité
-        ))
+        apprenants = apprenants.sort_values(
+            ['date_inscription', 'nom_complet'], ascending=[False, True], na_position='last'
+        )
         
         # Retirer la date du résultat final pour garder la même structure
-        for apprenant in apprenants:
-            del apprenant['date_inscription']
-        
-        return apprenants
+        return apprenants.drop(columns=['date_inscription']).to_dict('records')
     
     def get_apprenants_list(self):
         """Alias pour get_all_apprenants - compatibilité"""
@@ -458,74 +752,59 @@ class DataService:
             numero_apprenant, self.inscription_df, self.presence_df
         )
         
-        # Informations d'inscription
-        inscription = self.inscription_df[self.inscription_df['N°'] == numero_apprenant]
-        if inscription.empty:
+        # Informations d'inscription (recherche O(1) dans l'index construit au chargement)
+        apprenant_info = self._inscription_by_numero.get(numero_apprenant)
+        if apprenant_info is None:
             return {
                 'error': 'Apprenant non trouvé dans les inscriptions',
                 'validation': validation
             }
         
         # Nettoyer les valeurs NaN pour éviter les erreurs JSON
-        apprenant_info = inscription.iloc[0].to_dict()
-        apprenant_info_clean = {}
-        for key, value in apprenant_info.items():
-            if pd.isna(value):
-                apprenant_info_clean[key] = ''
-            elif isinstance(value, (int, float)) and pd.isna(value):
-                apprenant_info_clean[key] = 0
-            else:
-                apprenant_info_clean[key] = str(value) if not isinstance(value, (int, float, bool)) else value
+        # (une seule ligne : un parcours des champs suffit)
+        apprenant_info_clean = {
+            key: '' if pd.isna(value) else self._json_scalar(value)
+            for key, value in apprenant_info.items()
+        }
         
         # Informations de présence avec filtrage optionnel
         presences = []
         presence_status = "no_data"
         
+        # Statistiques de présence
+        total_presences = 0
+        nb_jours_uniques = 0
+        activites_uniques = []
+        total_heures_minutes = 0  # Total en minutes
+        
         if not self.presence_df.empty and validation['exists_presence']:
-            presence_apprenant = self.presence_df[self.presence_df['Numéro Apprenant'] == numero_apprenant]
+            presence_apprenant = self.presence_df.iloc[self._presence_positions.get(numero_apprenant, [])]
             
             # Appliquer le filtrage par dates si demandé
             if dates_filter:
                 presence_apprenant = self._filter_presences_by_date(presence_apprenant, dates_filter)
             
-            presences_raw = presence_apprenant.to_dict('records')
+            # Calculer les statistiques sur le DataFrame, avant la sérialisation
+            total_presences = len(presence_apprenant)
+            if 'Date du Jour' in presence_apprenant.columns:
+                nb_jours_uniques = int(self._valeurs_non_vides(presence_apprenant['Date du Jour']).nunique())
+            if 'Activités' in presence_apprenant.columns:
+                activites_uniques = [
+                    self._json_scalar(value)
+                    for value in self._valeurs_non_vides(presence_apprenant['Activités']).unique()
+                ]
+            if 'Durée Activité Apprenants' in presence_apprenant.columns:
+                total_heures_minutes = self._convertir_durees_en_minutes(
+                    presence_apprenant['Durée Activité Apprenants']
+                )
             
-            # Nettoyer les présences aussi
-            for presence in presences_raw:
-                presence_clean = {}
-                for key, value in presence.items():
-                    if pd.isna(value):
-                        presence_clean[key] = ''
-                    elif isinstance(value, (int, float)) and pd.isna(value):
-                        presence_clean[key] = 0
-                    else:
-                        presence_clean[key] = str(value) if not isinstance(value, (int, float, bool)) else value
-                presences.append(presence_clean)
+            # Nettoyer les présences aussi (colonne par colonne plutôt que cellule par cellule)
+            presences = self._json_safe_records(presence_apprenant)
             
             presence_status = "has_data" if presences else "no_presence"
         else:
             presence_status = "no_presence"
         
-        # Statistiques de présence
-        total_presences = len(presences)
-        dates_uniques = []
-        activites_uniques = set()
-        total_heures_minutes = 0  # Total en minutes
-        
-        if presences:
-            # Extraire les dates uniques et calculer les heures totales
-            for p in presences:
-                if 'Date du Jour' in p and p['Date du Jour'] and p['Date du Jour'] != '':
-                    dates_uniques.append(p['Date du Jour'])
-                if 'Activités' in p and p['Activités'] and p['Activités'] != '':
-                    activites_uniques.add(p['Activités'])
-                
-                # Calculer la durée en minutes
-                if 'Durée Activité Apprenants' in p and p['Durée Activité Apprenants']:
-                    duree_str = str(p['Durée Activité Apprenants'])
-                    total_heures_minutes += self._convertir_duree_en_minutes(duree_str)
-        
-        nb_jours_uniques = len(set(dates_uniques))
         
         # Calculer le taux de présence (basé sur un mois de 22 jours ouvrables)
         jours_ouvrables_mois = 22
@@ -543,7 +822,7 @@ class DataService:
             'statistiques': {
                 'total_presences': total_presences,
                 'jours_uniques': nb_jours_uniques,
-                'activites_uniques': list(activites_uniques),
+                'activites_uniques': activites_uniques,
                 'taux_presence': round(taux_presence, 1),
                 'total_heures': total_heures_format,
                 'total_minutes': total_heures_minutes
@@ -560,57 +839,12 @@ class DataService:
             eval_path = self.data_folder / 'grille_suivit_apprenant.xlsx'
             evaluations_list = []
             if eval_path.exists():
-                eval_df = pd.read_excel(eval_path)
-
-                # Normaliser les noms de colonnes pour faciliter la correspondance
-                def normalize_col(c):
-                    if not isinstance(c, str):
-                        return str(c)
-                    return c.strip().replace('\n', '').replace(' ', '_')
-
-                eval_df.columns = [normalize_col(c) for c in eval_df.columns]
-
-                # Colonnes attendues (apporter des alternatives si noms différents)
-                col_candidates = {
-                    'numero': ['Numero_apprenant', 'Numero', 'Numero_apprenant'.replace('\n','')],
-                    'date': ['Date', 'date', 'DATE'],
-                    'note': ['Note_test_sur_20', 'Note', 'Note_sur_20'],
-                    'compr_oral': ['Comprehension_orale', 'Comprehension_orale'.replace('\n','')],
-                    'compr_ecrit': ['Comprehension_ecrit', 'Comprehension_ecrit'.replace('\n',''), 'Comprehension_écrit', 'Comprehension_ecrit'],
-                    'prod_oral': ['Production_orale', 'Production_orale'.replace('\n','')],
-                    'prod_ecrit': ['Production_ecrit', 'Production_ecrit'.replace('\n','')],
-                    'observation': ['Observation', 'Observations'],
-                    'niveau': ['Niveau_global', 'Niveau']
-                }
+                # Colonnes déjà normalisées et numéro déjà converti en texte par le cache (lecture seule)
+                eval_df = self._get_evaluations_df(eval_path)
 
-                # Helper to find first existing column name
-                def find_col(df_cols, candidates):
-                    for c in candidates:
-                        if c in df_cols:
-                            return c
-                    return None
-
-                df_cols = set(eval_df.columns)
-                # Build a mapping from canonical keys to actual df columns
-                mapping = {}
-                mapping['numero'] = find_col(df_cols, col_candidates['numero'])
-                mapping['date'] = find_col(df_cols, col_candidates['date'])
-                mapping['note'] = find_col(df_cols, col_candidates['note'])
-                mapping['compr_oral'] = find_col(df_cols, col_candidates['compr_oral'])
-                mapping['compr_ecrit'] = find_col(df_cols, col_candidates['compr_ecrit'])
-                mapping['prod_oral'] = find_col(df_cols, col_candidates['prod_oral'])
-                mapping['prod_ecrit'] = find_col(df_cols, col_candidates['prod_ecrit'])
-                mapping['observation'] = find_col(df_cols, col_candidates['observation'])
-                mapping['niveau'] = find_col(df_cols, col_candidates['niveau'])
-
-                # Filtrer par numéro d'apprenant (comparer en str pour robustesse)
-                if mapping['numero']:
-                    # Convertir la colonne en chaîne pour comparaison
-                    eval_df[mapping['numero']] = eval_df[mapping['numero']].astype(str)
-                    mask = eval_df[mapping['numero']] == str(numero_apprenant)
-                    eval_filtered = eval_df[mask]
-                else:
-                    eval_filtered = pd.DataFrame()
+                # Correspondance des colonnes et index par numéro calculés au chargement du cache
+                mapping = self._eval_col_map
+                eval_filtered = eval_df.iloc[self._eval_by_numero.get(str(numero_apprenant), [])]
 
                 # Appliquer filtrage par dates si demandé
                 if not eval_filtered.empty and dates_filter and mapping['date']:
@@ -674,9 +908,7 @@ class DataService:
             grilles_path = self.data_folder / 'grilles_progression.json'
             grille_obj = None
             if grilles_path.exists():
-                import json
-                with open(grilles_path, 'r', encoding='utf-8') as fh:
-                    grilles = json.load(fh)
+                grilles = self._load_json_cached(grilles_path)
 
                 # Déterminer le niveau depuis la dernière évaluation si présente
                 niveau = None
@@ -708,12 +940,106 @@ class DataService:
         
         return result
     
+    @staticmethod
+    def _json_scalar(value):
+        """Garde les nombres et booléens tels quels, convertit les autres valeurs en texte"""
+        return value if isinstance(value, (int, float, bool)) else str(value)
+    
+    @classmethod
+    def _json_safe_records(cls, df):
+        """
+        Convertit un DataFrame en liste de dictionnaires sérialisables en JSON
+        
+        Les valeurs manquantes deviennent '' et les valeurs non numériques sont converties en texte.
+        Le traitement est fait par colonne : les colonnes numériques ou booléennes ne sont pas parcourues.
+        """
+        if df.empty:
+            return []
+        
+        columns = {}
+        for col in df.columns:
+            series = df[col]
+            if not (pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series)):
+                series = series.map(cls._json_scalar, na_action='ignore')
+            columns[col] = series.astype(object).where(series.notna(), '')
+        
+        return pd.DataFrame(columns, index=df.index).to_dict('records')
+    
+    def _load_json_cached(self, path):
+        """
+        Retourne le contenu d'un fichier JSON, relu uniquement si le fichier a changé
+        
+        Args:
+            path (Path): Fichier JSON (grilles, planning, configuration, classes)
+            
+        Les méthodes qui réécrivent ces fichiers retirent leur entrée du cache.
+        
+        Returns:
+            Contenu JSON partagé entre les appels (ne pas modifier en place)
+        """
+        mtime = path.stat().st_mtime_ns
+        cached = self._json_cache.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, _read_json_file(path))
+            self._json_cache[path] = cached
+        return cached[1]
+    
+    def _get_evaluations_df(self, eval_path):
+        """
+        Retourne le DataFrame de la grille d'évaluations, relu uniquement si le fichier a changé
+        
+        Args:
+            eval_path (Path): Chemin de grille_suivit_apprenant.xlsx
+            
+        Les noms de colonnes sont normalisés (espaces -> '_'), la colonne du numéro
+        d'apprenant est convertie en texte et la correspondance des colonnes
+        (self._eval_col_map) ainsi que les positions par numéro (self._eval_by_numero)
+        sont calculées une seule fois, au chargement.
+        
+        Returns:
+            pandas.DataFrame: Grille d'évaluations (ne pas modifier en place)
+        """
+        mtime = eval_path.stat().st_mtime
+        if self._eval_cache is None or mtime != self._eval_mtime:
+            eval_df = pd.read_excel(eval_path, engine=EXCEL_ENGINE)
+            
+            # Normaliser les noms de colonnes pour faciliter la correspondance
+            eval_df.columns = [
+                c.strip().replace('\n', '').replace(' ', '_') if isinstance(c, str) else str(c)
+                for c in eval_df.columns
+            ]
+            
+            # Correspondance clés canoniques -> colonnes réelles (première candidate présente)
+            df_cols = set(eval_df.columns)
+            mapping = {
+                key: next((c for c in candidates if c in df_cols), None)
+                for key, candidates in self.EVAL_COLUMN_CANDIDATES.items()
+            }
+            
+            # Convertir la colonne du numéro en chaîne et indexer les lignes par numéro
+            if mapping['numero']:
+                eval_df[mapping['numero']] = eval_df[mapping['numero']].astype(str)
+                by_numero = eval_df.groupby(mapping['numero'], sort=False).indices
+            else:
+                by_numero = {}
+            
+            self._eval_col_map = mapping
+            self._eval_by_numero = by_numero
+            self._eval_cache = eval_df
+            self._eval_mtime = mtime
+        return self._eval_cache
+    
     def _filter_presences_by_date(self, presences_df, dates_filter):
         """
         Filtre les présences selon une période de dates
         
+        self.presence_df est trié par date au chargement : la période est convertie en
+        un intervalle de positions [debut, fin) par recherche dichotomique, puis les lignes
+        de presences_df (sous-ensemble de self.presence_df, index conservé) sont gardées
+        si leur position tombe dans cet intervalle. Les dates invalides sont exclues.
+        
         Args:
-            presences_df (DataFrame): DataFrame des présences
+            presences_df (DataFrame): Présences extraites de self.presence_df
             dates_filter (dict): Dictionnaire avec 'debut' et/ou 'fin'
             
         Returns:
@@ -721,55 +1047,73 @@ class DataService:
         """
         if dates_filter is None or presences_df.empty:
             return presences_df
-            
-        filtered_df = presences_df.copy()
         
-        # Convertir la colonne de date si elle existe
-        if 'Date du Jour' in filtered_df.columns:
-            # Essayer différents formats de date
-            date_col = filtered_df['Date du Jour'].copy()
-            
-            # Convertir les dates au format datetime
-            converted_dates = []
-            for date_val in date_col:
-                if pd.isna(date_val) or date_val == '':
-                    converted_dates.append(pd.NaT)
-                    continue
-                    
-                try:
-                    # Essayer format DD/MM/YYYY
-                    if isinstance(date_val, str) and '/' in date_val:
-                        parts = date_val.split('/')
-                        if len(parts) == 3:
-                            converted_date = pd.to_datetime(f"{parts[2]}-{parts[1]}-{parts[0]}")
-                            converted_dates.append(converted_date)
-                            continue
-                    
-                    # Essayer conversion directe
-                    converted_dates.append(pd.to_datetime(date_val))
-                except:
-                    converted_dates.append(pd.NaT)
-            
-            filtered_df['Date_Converted'] = converted_dates
-            
-            # Appliquer les filtres
-            if 'debut' in dates_filter:
-                debut = pd.to_datetime(dates_filter['debut'])
-                filtered_df = filtered_df[filtered_df['Date_Converted'] >= debut]
-                
-            if 'fin' in dates_filter:
-                fin = pd.to_datetime(dates_filter['fin'])
-                filtered_df = filtered_df[filtered_df['Date_Converted'] <= fin]
-                
-            # Supprimer la colonne temporaire
-            filtered_df = filtered_df.drop('Date_Converted', axis=1)
+        if 'Date du Jour' not in presences_df.columns:
+            return presences_df.copy()
+        
+        # Les dates NaT sont en fin de tableau : la borne haute par défaut les exclut
+        debut_pos = 0
+        fin_pos = self._presence_valid_dates
+        if 'debut' in dates_filter:
+            debut = pd.to_datetime(dates_filter['debut']).to_datetime64()
+            debut_pos = self._presence_dates[:fin_pos].searchsorted(debut, side='left')
+        if 'fin' in dates_filter:
+            fin = pd.to_datetime(dates_filter['fin']).to_datetime64()
+            fin_pos = self._presence_dates[:fin_pos].searchsorted(fin, side='right')
+        
+        positions = presences_df.index.to_numpy()
+        return presences_df[(positions >= debut_pos) & (positions < fin_pos)]
+    
+    def _get_parsed_dates(self, presences_df):
+        """
+        Dates 'Date du Jour' converties (datetime64, NaT si invalides) pour des lignes de self.presence_df
+        
+        Réutilise les dates converties une fois au chargement (self._presence_dates, alignées
+        sur les positions) au lieu de relancer pd.to_datetime à chaque appel.
+        """
+        return pd.Series(self._presence_dates[presences_df.index.to_numpy()], index=presences_df.index)
+    
+    @staticmethod
+    def _parse_presence_dates(dates):
+        """
+        Convertit la colonne 'Date du Jour' en datetime64 (NaT si vide ou invalide)
+        
+        Format DD/MM/YYYY (texte nettoyé) en une passe, puis une seconde passe en formats
+        mixtes (jour en premier) uniquement sur les valeurs encore non converties.
+        """
+        parsed = pd.to_datetime(dates, format='%d/%m/%Y', errors='coerce')
         
-        return filtered_df
+        reste = parsed.isna() & dates.notna() & (dates != '')
+        if reste.any():
+            parsed[reste] = pd.to_datetime(dates[reste], format='mixed', dayfirst=True, errors='coerce')
+        
+        return parsed
+    
+    def _sort_presences_by_date(self):
+        """
+        Trie self.presence_df par date (tri stable, dates invalides en dernier) et
+        conserve les dates converties alignées sur les positions (self._presence_dates)
+        """
+        if self.presence_df.empty or 'Date du Jour' not in self.presence_df.columns:
+            self._presence_dates = pd.Series(pd.NaT, index=self.presence_df.index, dtype='datetime64[ns]').to_numpy()
+            self._presence_valid_dates = 0
+            return
+        
+        dates = self._parse_presence_dates(self.presence_df['Date du Jour'])
+        # numpy place les NaT en fin de tri
+        order = dates.to_numpy().argsort(kind='stable')
+        self.presence_df = self.presence_df.take(order).reset_index(drop=True)
+        self._presence_dates = dates.to_numpy()[order]
+        self._presence_valid_dates = int(dates.notna().sum())
     
-    def _convertir_duree_en_minutes(self, duree_str):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _convertir_duree_en_minutes(duree_str):
         """
         Convertit une durée en format texte vers des minutes
         
+        Mémoïsée : les durées saisies forment un petit vocabulaire de valeurs répétées.
+        
         Args:
             duree_str (str): Durée au format "HH:MM", "Xh", "XhYY", "X h YY", etc.
             
@@ -783,22 +1127,19 @@ class DataService:
         
         try:
             # Format "HH:MM" ou "H:MM"
-            if ':' in duree:
-                parts = duree.split(':')
-                if len(parts) == 2:
-                    heures = int(parts[0])
-                    minutes = int(parts[1])
-                    return (heures * 60) + minutes
+            heures, separateur, minutes = duree.partition(':')
+            if separateur and ':' not in minutes:
+                return (int(heures) * 60) + int(minutes)
             
             # Format "Xh" ou "XhYY" ou "X h YY"
-            match_heure = re.match(r'(\d+)\s*h(?:\s*(\d+))?', duree)
+            match_heure = DataService._DUREE_HEURES_RE.match(duree)
             if match_heure:
                 heures = int(match_heure.group(1))
                 minutes = int(match_heure.group(2)) if match_heure.group(2) else 0
                 return (heures * 60) + minutes
             
             # Format "XX min" ou "XXmin"
-            match_min = re.match(r'(\d+)\s*min', duree)
+            match_min = DataService._DUREE_MINUTES_RE.match(duree)
             if match_min:
                 return int(match_min.group(1))
             
@@ -814,6 +1155,32 @@ class DataService:
             
         return 0
     
+    @staticmethod
+    def _valeurs_non_vides(series):
+        """Retourne les valeurs renseignées (ni NaN, ni chaîne vide) d'une colonne"""
+        return series[series.notna() & (series != '')]
+    
+    @classmethod
+    def _convertir_durees_en_minutes(cls, durees):
+        """
+        Somme une colonne de durées en minutes
+        
+        Chaque valeur distincte passe une seule fois par _convertir_duree_en_minutes
+        (seul analyseur des formats de durée), puis le résultat est projeté sur la colonne.
+        
+        Args:
+            durees (pd.Series): Durées au format "HH:MM", "Xh", "XhYY", "XX min", "X.Y", etc.
+            
+        Returns:
+            int: Nombre total de minutes
+        """
+        durees = cls._valeurs_non_vides(durees)
+        if durees.empty:
+            return 0
+        
+        minutes_par_valeur = {valeur: cls._convertir_duree_en_minutes(valeur) for valeur in durees.unique()}
+        return int(durees.map(minutes_par_valeur).sum())
+    
     def _convertir_minutes_en_heures(self, total_minutes):
         """
         Convertit des minutes en format HHhMM
@@ -867,7 +1234,8 @@ class DataService:
                 'status': 'no_data'
             }
         
-        presence_apprenant = self.presence_df[self.presence_df['Numéro Apprenant'] == numero_apprenant]
+        # Positions des présences de l'apprenant précalculées au chargement (pas de parcours de la colonne)
+        presence_apprenant = self.presence_df.iloc[self._presence_positions.get(numero_apprenant, [])]
         
         if presence_apprenant.empty:
             return {
@@ -895,8 +1263,8 @@ class DataService:
         
         # Grouper par date
         try:
-            # Les dates sont déjà nettoyées par le service de nettoyage
-            presence_apprenant['Date du Jour'] = pd.to_datetime(presence_apprenant['Date du Jour'], format='%d/%m/%Y', errors='coerce')
+            # Dates déjà converties au chargement (une seule conversion par chargement des données)
+            presence_apprenant = presence_apprenant.assign(**{'Date du Jour': self._get_parsed_dates(presence_apprenant)})
             # Supprimer les dates NaT (Not a Time)
             presence_apprenant = presence_apprenant.dropna(subset=['Date du Jour'])
             
@@ -944,7 +1312,8 @@ class DataService:
                 'status': 'no_data'
             }
         
-        presence_apprenant = self.presence_df[self.presence_df['Numéro Apprenant'] == numero_apprenant]
+        # Positions des présences de l'apprenant précalculées au chargement (pas de parcours de la colonne)
+        presence_apprenant = self.presence_df.iloc[self._presence_positions.get(numero_apprenant, [])]
         
         if presence_apprenant.empty:
             return {
@@ -963,8 +1332,8 @@ class DataService:
                 }
         
         try:
-            # Les dates sont déjà nettoyées au format DD/MM/YYYY
-            presence_apprenant['Date du Jour'] = pd.to_datetime(presence_apprenant['Date du Jour'], format='%d/%m/%Y', errors='coerce')
+            # Dates déjà converties au chargement (une seule conversion par chargement des données)
+            presence_apprenant = presence_apprenant.assign(**{'Date du Jour': self._get_parsed_dates(presence_apprenant)})
             presence_apprenant = presence_apprenant.dropna(subset=['Date du Jour'])
             
             if presence_apprenant.empty:
@@ -1006,7 +1375,8 @@ class DataService:
         if self.presence_df.empty:
             return {'labels': [], 'data': [], 'moyenne_mobile': [], 'periodes': []}
         
-        presence_apprenant = self.presence_df[self.presence_df['Numéro Apprenant'] == numero_apprenant]
+        # Positions des présences de l'apprenant précalculées au chargement (pas de parcours de la colonne)
+        presence_apprenant = self.presence_df.iloc[self._presence_positions.get(numero_apprenant, [])]
         
         if presence_apprenant.empty:
             return {'labels': [], 'data': [], 'moyenne_mobile': [], 'periodes': []}
@@ -1019,8 +1389,8 @@ class DataService:
                 return {'labels': [], 'data': [], 'moyenne_mobile': [], 'periodes': []}
         
         try:
-            # Convertir les dates
-            presence_apprenant['Date du Jour'] = pd.to_datetime(presence_apprenant['Date du Jour'], errors='coerce')
+            # Dates déjà converties au chargement (une seule conversion par chargement des données)
+            presence_apprenant = presence_apprenant.assign(**{'Date du Jour': self._get_parsed_dates(presence_apprenant)})
             presence_apprenant = presence_apprenant.dropna(subset=['Date du Jour'])
             
             if presence_apprenant.empty:
@@ -1036,25 +1406,14 @@ class DataService:
             # Compter les présences par date
             presence_by_date = presence_apprenant.groupby(presence_apprenant['Date du Jour'].dt.date).size()
             
-            # Créer un DataFrame avec toutes les dates et remplir les manquantes avec 0
-            evolution_data = []
-            labels = []
-            
-            for date in toutes_dates:
-                date_str = date.strftime('%Y-%m-%d')
-                labels.append(date_str)
-                count = presence_by_date.get(date.date(), 0)
-                evolution_data.append(int(count))
+            # Toutes les dates de la période, les jours sans présence à 0
+            labels = toutes_dates.strftime('%Y-%m-%d').tolist()
+            evolution = presence_by_date.reindex(toutes_dates.date, fill_value=0).astype(int)
+            evolution_data = evolution.tolist()
             
-            # Calculer une moyenne mobile sur 7 jours pour lisser la courbe
-            moyenne_mobile = []
-            window_size = 7
-            
-            for i in range(len(evolution_data)):
-                start_idx = max(0, i - window_size // 2)
-                end_idx = min(len(evolution_data), i + window_size // 2 + 1)
-                moyenne = sum(evolution_data[start_idx:end_idx]) / (end_idx - start_idx)
-                moyenne_mobile.append(round(moyenne, 2))
+            # Calculer une moyenne mobile centrée sur 7 jours pour lisser la courbe
+            # (fenêtre tronquée aux bords de la période)
+            moyenne_mobile = evolution.rolling(window=7, center=True, min_periods=1).mean().round(2).tolist()
             
             # Identifier les périodes de forte/faible présence
             periodes = self._identifier_periodes_presence(evolution_data, labels)
@@ -1074,52 +1433,37 @@ class DataService:
             return {'labels': [], 'data': [], 'moyenne_mobile': [], 'periodes': [], 'error': str(e)}
     
     def _identifier_periodes_presence(self, data, labels):
-        """Identifier les périodes de forte et faible présence"""
+        """
+        Identifier les périodes de forte et faible présence
+        
+        Chaque jour est classé forte (>= 1,5 x moyenne), faible (<= 0,5 x moyenne) ou neutre ;
+        les jours neutres prolongent la période en cours. Une période commence à chaque
+        changement de classe non neutre et se termine la veille de la suivante.
+        """
         if not data:
             return []
         
-        moyenne_generale = sum(data) / len(data)
-        periodes = []
+        valeurs = np.asarray(data, dtype=np.float64)
+        moyenne_generale = valeurs.mean()
         
-        # Seuils pour définir les périodes
+        # Seuils pour définir les périodes (forte prioritaire, comme une moyenne nulle)
         seuil_forte = moyenne_generale * 1.5
         seuil_faible = moyenne_generale * 0.5
+        classes = np.where(valeurs >= seuil_forte, 1, np.where(valeurs <= seuil_faible, -1, 0))
         
-        periode_actuelle = None
-        debut_periode = None
-        
-        for i, (valeur, label) in enumerate(zip(data, labels)):
-            if valeur >= seuil_forte and periode_actuelle != 'forte':
-                # Début d'une période de forte présence
-                if periode_actuelle and debut_periode:
-                    periodes.append({
-                        'type': periode_actuelle,
-                        'debut': debut_periode,
-                        'fin': labels[i-1] if i > 0 else label
-                    })
-                periode_actuelle = 'forte'
-                debut_periode = label
-                
-            elif valeur <= seuil_faible and periode_actuelle != 'faible':
-                # Début d'une période de faible présence
-                if periode_actuelle and debut_periode:
-                    periodes.append({
-                        'type': periode_actuelle,
-                        'debut': debut_periode,
-                        'fin': labels[i-1] if i > 0 else label
-                    })
-                periode_actuelle = 'faible'
-                debut_periode = label
-        
-        # Fermer la dernière période
-        if periode_actuelle and debut_periode:
-            periodes.append({
-                'type': periode_actuelle,
-                'debut': debut_periode,
-                'fin': labels[-1]
-            })
-        
-        return periodes
+        # Positions des jours non neutres et début de chaque suite de même classe
+        non_neutres = np.flatnonzero(classes)
+        if non_neutres.size == 0:
+            return []
+        classes_nn = classes[non_neutres]
+        debuts = non_neutres[np.r_[True, classes_nn[1:] != classes_nn[:-1]]]
+        fins = np.r_[debuts[1:] - 1, len(valeurs) - 1]
+        
+        labels = np.asarray(labels, dtype=object)
+        return [
+            {'type': 'forte' if classe == 1 else 'faible', 'debut': debut, 'fin': fin}
+            for classe, debut, fin in zip(classes[debuts], labels[debuts], labels[fins])
+        ]
 
     def add_presence(self, data):
         """Ajouter une nouvelle présence au fichier Excel"""
@@ -1176,9 +1520,7 @@ class DataService:
             planning_file = self.data_folder / f'planning_{semaine}.json'
             
             if planning_file.exists():
-                import json
-                with open(planning_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return self._load_json_cached(planning_file)
             else:
                 return []
         except Exception as e:
@@ -1188,7 +1530,6 @@ class DataService:
     def creer_atelier(self, data):
         """Créer un nouvel atelier"""
         try:
-            import json
             from datetime import datetime
             
             # Générer un ID unique
@@ -1202,15 +1543,14 @@ class DataService:
             
             ateliers = []
             if planning_file.exists():
-                with open(planning_file, 'r', encoding='utf-8') as f:
-                    ateliers = json.load(f)
+                ateliers = _read_json_file(planning_file)
             
             # Ajouter le nouvel atelier
             ateliers.append(data)
             
             # Sauvegarder
-            with open(planning_file, 'w', encoding='utf-8') as f:
-                json.dump(ateliers, f, ensure_ascii=False, indent=2)
+            _write_json_file(planning_file, ateliers)
+            self._json_cache.pop(planning_file, None)
             
             return atelier_id
         except Exception as e:
@@ -1219,7 +1559,6 @@ class DataService:
     def modifier_atelier(self, data):
         """Modifier un atelier existant"""
         try:
-            import json
             from datetime import datetime
             
             data['date_modification'] = datetime.now().isoformat()
@@ -1231,8 +1570,7 @@ class DataService:
             if not planning_file.exists():
                 raise Exception("Planning non trouvé")
             
-            with open(planning_file, 'r', encoding='utf-8') as f:
-                ateliers = json.load(f)
+            ateliers = _read_json_file(planning_file)
             
             # Trouver et modifier l'atelier
             atelier_trouve = False
@@ -1246,8 +1584,8 @@ class DataService:
                 raise Exception("Atelier non trouvé")
             
             # Sauvegarder
-            with open(planning_file, 'w', encoding='utf-8') as f:
-                json.dump(ateliers, f, ensure_ascii=False, indent=2)
+            _write_json_file(planning_file, ateliers)
+            self._json_cache.pop(planning_file, None)
             
             return data['id']
         except Exception as e:
@@ -1256,20 +1594,17 @@ class DataService:
     def supprimer_atelier(self, atelier_id):
         """Supprimer un atelier"""
         try:
-            import json
-            
             # Chercher dans tous les plannings (on ne connaît pas la semaine)
             for planning_file in self.data_folder.glob('planning_*.json'):
-                with open(planning_file, 'r', encoding='utf-8') as f:
-                    ateliers = json.load(f)
+                ateliers = _read_json_file(planning_file)
                 
                 # Filtrer l'atelier à supprimer
                 ateliers_filtres = [a for a in ateliers if a.get('id') != atelier_id]
                 
                 if len(ateliers_filtres) != len(ateliers):
                     # L'atelier a été trouvé et supprimé
-                    with open(planning_file, 'w', encoding='utf-8') as f:
-                        json.dump(ateliers_filtres, f, ensure_ascii=False, indent=2)
+                    _write_json_file(planning_file, ateliers_filtres)
+                    self._json_cache.pop(planning_file, None)
                     return True
             
             raise Exception("Atelier non trouvé")
@@ -1279,13 +1614,11 @@ class DataService:
     def get_horaires_planning_defaut(self):
         """Récupérer les horaires par défaut du planning"""
         try:
-            import json
             config_file = self.data_folder / 'config_planning.json'
             
             if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    return config.get('horaires_defaut', [])
+                config = self._load_json_cached(config_file)
+                return config.get('horaires_defaut', [])
             
             # Horaires par défaut si pas de configuration
             return [
@@ -1300,18 +1633,16 @@ class DataService:
     def modifier_horaires_planning_defaut(self, horaires):
         """Modifier les horaires par défaut du planning"""
         try:
-            import json
             config_file = self.data_folder / 'config_planning.json'
             
             config = {}
             if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = _read_json_file(config_file)
             
             config['horaires_defaut'] = horaires
             
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            _write_json_file(config_file, config)
+            self._json_cache.pop(config_file, None)
             
             return True
         except Exception as e:
@@ -1366,8 +1697,6 @@ class DataService:
     def dupliquer_planning_semaine(self, semaine_source, semaine_cible):
         """Dupliquer un planning d'une semaine vers une autre"""
         try:
-            import json
-            
             # Charger le planning source
             ateliers_source = self.get_ateliers_par_semaine(semaine_source)
             
@@ -1385,8 +1714,8 @@ class DataService:
             
             # Sauvegarder le planning cible
             planning_file = self.data_folder / f'planning_{semaine_cible}.json'
-            with open(planning_file, 'w', encoding='utf-8') as f:
-                json.dump(ateliers_cible, f, ensure_ascii=False, indent=2)
+            _write_json_file(planning_file, ateliers_cible)
+            self._json_cache.pop(planning_file, None)
             
             return len(ateliers_cible)
         except Exception as e:
@@ -1590,12 +1919,10 @@ class DataService:
     def get_classes(self):
         """Récupérer toutes les classes définies"""
         try:
-            import json
             classes_file = self.data_folder / 'classes.json'
             
             if classes_file.exists():
-                with open(classes_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return self._load_json_cached(classes_file)
             else:
                 return []
         except Exception as e:
@@ -1690,15 +2017,12 @@ class DataService:
     def supprimer_classe(self, classe_id):
         """Supprimer une classe"""
         try:
-            import json
-            
             classes_file = self.data_folder / 'classes.json'
             
             if not classes_file.exists():
                 raise Exception("Fichier des classes non trouvé")
             
-            with open(classes_file, 'r', encoding='utf-8') as f:
-                classes = json.load(f)
+            classes = _read_json_file(classes_file)
             
             # Filtrer la classe à supprimer
             classes_filtrees = [c for c in classes if c.get('id') != classe_id]
@@ -1707,8 +2031,8 @@ class DataService:
                 raise Exception("Classe non trouvée")
             
             # Sauvegarder
-            with open(classes_file, 'w', encoding='utf-8') as f:
-                json.dump(classes_filtrees, f, ensure_ascii=False, indent=2)
+            _write_json_file(classes_file, classes_filtrees)
+            self._json_cache.pop(classes_file, None)
             
             return True
         except Exception as e:
@@ -1733,15 +2057,12 @@ class DataService:
             dict: Mapping nom_encadrant -> numero_encadrant
         """
         try:
-            import json
-            
             config_file = self.data_folder / 'config_planning.json'
             
             if not config_file.exists():
                 return {}
             
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = self._load_json_cached(config_file)
             
             return config.get('encadrants', {})
         except Exception as e:
@@ -1760,8 +2081,6 @@ class DataService:
             bool: True si succès, False sinon
         """
         try:
-            import json
-            
             # Validation du format du numéro
             import re
             if not re.match(r'^\d{2}-\d{3}$', numero_encadrant):
@@ -1771,8 +2090,7 @@ class DataService:
             config_file = self.data_folder / 'config_planning.json'
             
             if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = _read_json_file(config_file)
             else:
                 config = {
                     "horaires_defaut": [],
@@ -1794,8 +2112,8 @@ class DataService:
             config['encadrants'][nom_encadrant] = numero_encadrant
             
             # Sauvegarder
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            _write_json_file(config_file, config)
+            self._json_cache.pop(config_file, None)
             
             return True
             
@@ -1813,23 +2131,20 @@ class DataService:
             bool: True si succès, False sinon
         """
         try:
-            import json
-            
             config_file = self.data_folder / 'config_planning.json'
             
             if not config_file.exists():
                 return False
             
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = _read_json_file(config_file)
             
             if 'encadrants' not in config or nom_encadrant not in config['encadrants']:
                 return False
             
             del config['encadrants'][nom_encadrant]
             
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            _write_json_file(config_file, config)
+            self._json_cache.pop(config_file, None)
             
             return True
             
@@ -1844,14 +2159,12 @@ class DataService:
             dict: Résultat de l'import avec statistiques
         """
         try:
-            import json
-            
             # Charger presence.xlsx
             presence_file = self.data_folder / 'presence.xlsx'
             if not presence_file.exists():
                 return {'success': False, 'error': 'Fichier presence.xlsx non trouvé'}
             
-            df_presence = pd.read_excel(presence_file)
+            df_presence = pd.read_excel(presence_file, engine=EXCEL_ENGINE)
             
             # Extraire les mappings uniques encadrant -> numéro
             mappings = df_presence[['Encadrant', 'Numéro Encadrant']].dropna().drop_duplicates()
@@ -1859,8 +2172,7 @@ class DataService:
             # Charger la config actuelle
             config_file = self.data_folder / 'config_planning.json'
             if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = _read_json_file(config_file)
             else:
                 config = {"encadrants": {}}
             
@@ -1897,8 +2209,8 @@ class DataService:
                         config['encadrants'][nom] = numero
             
             # Sauvegarder
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            _write_json_file(config_file, config)
+            self._json_cache.pop(config_file, None)
             
             return {
                 'success': True,
@@ -1953,15 +2265,13 @@ class DataService:
     def retirer_apprenant_de_classe(self, classe_id, numero_apprenant):
         """Retirer un apprenant d'une classe"""
         try:
-            import json
             classes_file = self.data_folder / 'classes.json'
             
             if not classes_file.exists():
                 return False
             
             # Charger les classes
-            with open(classes_file, 'r', encoding='utf-8') as f:
-                classes = json.load(f)
+            classes = _read_json_file(classes_file)
             
             # Trouver la classe
             classe_trouvee = False
@@ -1976,8 +2286,8 @@ class DataService:
                 return False
             
             # Sauvegarder les modifications
-            with open(classes_file, 'w', encoding='utf-8') as f:
-                json.dump(classes, f, ensure_ascii=False, indent=2)
+            _write_json_file(classes_file, classes)
+            self._json_cache.pop(classes_file, None)
             
             return True
             
@@ -159,11 +159,11 @@ class InscriptionService(BaseService):
                 
                 # Recherche dans les colonnes NOM et Prénom (noms Excel corrects)
                 if 'NOM' in df.columns:
-                    mask |= df['NOM'].astype(str).str.lower().str.contains(search_lower, na=False)
+                    mask |= df['NOM'].astype(str).str.lower().str.contains(search_lower, regex=False, na=False)
                 if 'Prénom' in df.columns:
-                    mask |= df['Prénom'].astype(str).str.lower().str.contains(search_lower, na=False)
+                    mask |= df['Prénom'].astype(str).str.lower().str.contains(search_lower, regex=False, na=False)
                 if 'N°' in df.columns:
-                    mask |= df['N°'].astype(str).str.contains(search, na=False)
+                    mask |= df['N°'].astype(str).str.contains(search, regex=False, na=False)
                     
                 df = df[mask]
             
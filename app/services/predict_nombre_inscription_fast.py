@@ -296,10 +296,7 @@ def create_fast_prediction_service(data_folder_path):
         
         # Preprocessing rapide
         preprocessor = DataPreprocessor(data_folder_path)
-        preprocessor.load_data()
-        preprocessor.handle_missing_values()
-        preprocessor.create_temporal_features()
-        preprocessor.encode_categorical_features()
+        preprocessor.run_preprocessing()
         
         # Service de prédiction rapide
         prediction_service = FastPredictionService(preprocessor)